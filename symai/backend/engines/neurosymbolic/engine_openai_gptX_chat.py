@@ -1,6 +1,7 @@
 import asyncio
 import logging
 import re
+import threading
 from typing import List, Optional
 
 import openai
@@ -134,7 +135,16 @@ class GPTXChatEngine(Engine, OpenAIMixin):
         self.max_response_tokens = self.api_max_response_tokens()
         self.seed                = None
         self.except_remedy       = None
-        self.client    = openai.AsyncClient(api_key=openai.api_key)
+        self._clients            = threading.local()
+
+    @property
+    def client(self) -> openai.AsyncClient:
+        # every forward runs its own event loop with asyncio.run and the connection pool of a client is guarded by asyncio locks
+        # engines shared by Parallel(threads=True) workers therefore use one client per thread instead of one for all loops
+        client = getattr(self._clients, 'client', None)
+        if client is None:
+            client = self._clients.client = openai.AsyncClient(api_key=openai.api_key)
+        return client
 
     def id(self) -> str:
         if   self.config.get('NEUROSYMBOLIC_ENGINE_MODEL') and \
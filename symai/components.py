@@ -150,9 +150,10 @@ class Sequence(TrackerTraceable):
 
 
 class Parallel(Expression):
-    def __init__(self, *expr: List[Expression], sequential: bool = False, **kwargs):
+    def __init__(self, *expr: List[Expression], sequential: bool = False, threads: bool = False, **kwargs):
         super().__init__(**kwargs)
         self.sequential: bool       = sequential
+        self.threads: bool          = threads
         self.expr: List[Expression] = expr
         self.results: List[Symbol]  = []
 
@@ -161,7 +162,7 @@ class Parallel(Expression):
         if self.sequential:
             return [e(*args, **kwargs) for e in self.expr]
         # run in parallel
-        @core_ext.parallel(self.expr)
+        @core_ext.parallel(self.expr, threads=self.threads)
         def _func(e, *args, **kwargs):
             return e(*args, **kwargs)
         self.results = _func(*args, **kwargs)
@@ -14,25 +14,31 @@ class DictFormatConstraint:
             raise InvalidPropertyException(f"Unsupported format type: {type(format)}")
 
     def __call__(self, input: Symbol):
-        input = Symbol(input)
-        if input.value_type == str:
+        # engine responses are plain json strings, which are parsed without wrapping them into a new symbol
+        value = input.value if isinstance(input, Symbol) else input
+        if type(value) == str:
             try:
-                gen_dict = json.loads(input.value)
+                gen_dict = json.loads(value)
             except json.JSONDecodeError as e:
-                raise ConstraintViolationException(f"Invalid JSON: ```json\n{input.value}\n```\n{e}")
+                raise ConstraintViolationException(f"Invalid JSON: ```json\n{value}\n```\n{e}")
             return DictFormatConstraint.check_keys(self.format, gen_dict)
-        elif input.value_type == dict:
+        # other values are wrapped to unwrap any nested symbols
+        input = Symbol(value)
+        if input.value_type == dict:
             return DictFormatConstraint.check_keys(self.format, input.value)
         else:
             raise ConstraintViolationException(f"Unsupported input type: {input.value_type}")
 
     @staticmethod
     def check_keys(json_format, gen_dict):
-        for key, value in json_format.items():
-            if not str(key).startswith('{') and not str(key).endswith('}') and \
-                key not in gen_dict or not isinstance(gen_dict[key], type(value)):
-                raise ConstraintViolationException(f"Key `{key}` not found or type `{type(key)}` mismatch")
-            if isinstance(gen_dict[key], dict):
-                # on a dictionary, descend recursively
-                return DictFormatConstraint.check_keys(value, gen_dict[key])
-        return True
+        while True:
+            for key, value in json_format.items():
+                if not str(key).startswith('{') and not str(key).endswith('}') and \
+                    key not in gen_dict or not isinstance(gen_dict[key], type(value)):
+                    raise ConstraintViolationException(f"Key `{key}` not found or type `{type(key)}` mismatch")
+                if isinstance(gen_dict[key], dict):
+                    # on a dictionary, descend into the next level without recursion
+                    json_format, gen_dict = value, gen_dict[key]
+                    break
+            else:
+                return True
@@ -14,6 +14,21 @@ from .symbol import Expression, Metadata
 class Argument(Expression):
     _default_suppress_verbose_output            = False
     _default_parse_system_instructions          = False
+    _default_properties                         = {
+        'preview':          False,
+        'raw_input':        False,
+        'raw_output':       False,
+        'logging':          False,
+        'verbose':          False,
+        'response_format':  None,
+        'log_level':        None,
+        'time_clock':       None,
+        'payload':          None,
+        'processed_input':  None,
+        'template_suffix':  None,
+        'input_handler':    None,
+        'output_handler':   None
+    }
 
     def __init__(self, args, signature_kwargs, decorator_kwargs, **kwargs):
         super().__init__(**kwargs)
@@ -26,40 +41,15 @@ class Argument(Expression):
         self._set_all_kwargs_as_properties()
         # Set default values if not specified for backend processing
         # Reserved keywords
-        if 'preview' not in self.kwargs:
-            self.prop.preview           = False
-        if 'raw_input' not in self.kwargs:
-            self.prop.raw_input         = False
-        if 'raw_output' not in self.kwargs:
-            self.prop.raw_output        = False
-        if 'logging' not in self.kwargs:
-            self.prop.logging           = False
-        if 'verbose' not in self.kwargs:
-            self.prop.verbose           = False
-        if 'response_format' not in self.kwargs:
-            self.prop.response_format   = None
-        if 'log_level' not in self.kwargs:
-            self.prop.log_level         = None
-        if 'time_clock' not in self.kwargs:
-            self.prop.time_clock        = None
-        if 'payload' not in self.kwargs:
-            self.prop.payload           = None
-        if 'processed_input' not in self.kwargs:
-            self.prop.processed_input   = None
-        if 'template_suffix' not in self.kwargs:
-            self.prop.template_suffix   = None
-        if 'input_handler' not in self.kwargs:
-            self.prop.input_handler     = None
-        if 'output_handler' not in self.kwargs:
-            self.prop.output_handler    = None
-        if 'suppress_verbose_output' not in self.kwargs:
-            self.prop.suppress_verbose_output    = Argument._default_suppress_verbose_output
-        if 'parse_system_instructions' not in self.kwargs:
-            self.prop.parse_system_instructions  = Argument._default_parse_system_instructions
+        properties            = vars(self.prop)
+        for key, value in Argument._default_properties.items():
+            properties.setdefault(key, value)
+        properties.setdefault('suppress_verbose_output',   Argument._default_suppress_verbose_output)
+        properties.setdefault('parse_system_instructions', Argument._default_parse_system_instructions)
 
     def _set_all_kwargs_as_properties(self):
-        for key, value in self.kwargs.items():
-            setattr(self.prop, key, value)
+        # metadata attributes live in its instance dictionary and are set in one update
+        vars(self.prop).update(self.kwargs)
 
     @property
     def value(self):
@@ -12,6 +12,7 @@ import multiprocessing as mp
 from . import __root_dir__
 from typing import Callable, List
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from pathos.multiprocessing import ProcessingPool as PPool
 
 from .functional import EngineRepository
@@ -26,8 +27,14 @@ def _run_in_process(expr, func, args, kwargs):
     func = dill.loads(func)
     return func(expr, *args, **kwargs)
 
-def _parallel(func: Callable, expressions: List[Callable], worker: int = mp.cpu_count() // 2):
+def _parallel(func: Callable, expressions: List[Callable], worker: int = mp.cpu_count() // 2, threads: bool = False):
     def proxy_function(*args, **kwargs):
+        # engine calls are I/O bound and release the GIL, so threads avoid pickling and spawning processes
+        # the engines are shared by all threads, engines with event loop bound clients keep one client per thread
+        if threads:
+            with ThreadPoolExecutor(max_workers=max(worker, 1)) as executor:
+                futures = [executor.submit(func, expr, *args, **kwargs) for expr in expressions]
+                return [future.result() for future in futures]
         # Pickle the expressions using dill
         pickled_exprs = [dill.dumps(expr) for expr in expressions]
         pickled_func = dill.dumps(func)
@@ -38,12 +45,12 @@ def _parallel(func: Callable, expressions: List[Callable], worker: int = mp.cpu_
     return proxy_function
 
 # Decorator
-def parallel(expressions: List[Callable], worker: int = mp.cpu_count() // 2):
+def parallel(expressions: List[Callable], worker: int = mp.cpu_count() // 2, threads: bool = False):
     def decorator_parallel(func):
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             # Run expressions in parallel
-            parallel_func = _parallel(func, expressions, worker=worker)
+            parallel_func = _parallel(func, expressions, worker=worker, threads=threads)
             # Call the proxy function to execute in parallel and capture results
             results = parallel_func(*args, **kwargs)
             return results
@@ -4,6 +4,7 @@ import traceback
 import importlib
 import pkgutil
 import logging
+import weakref
 
 from enum import Enum
 from typing import Callable, Dict, List, Optional
@@ -38,6 +39,16 @@ from .prompts import (
 )
 
 
+def _boolean_tokens(tokens: str) -> frozenset:
+    # accept each listed token with and without its surrounding quotes
+    parts = tokens.split(', ')
+    return frozenset(parts + [part.strip("'") for part in parts])
+
+
+_PROBABILISTIC_BOOLEAN_MEDIUM   = _boolean_tokens(ProbabilisticBooleanModeMedium)
+_PROBABILISTIC_BOOLEAN_TOLERANT = _boolean_tokens(ProbabilisticBooleanModeTolerant)
+
+
 def _probabilistic_bool(rsp: str, mode=ProbabilisticBooleanMode.TOLERANT) -> bool:
     if rsp is None:
         return False
@@ -46,14 +57,18 @@ def _probabilistic_bool(rsp: str, mode=ProbabilisticBooleanMode.TOLERANT) -> boo
     if   mode == ProbabilisticBooleanMode.STRICT:
         return val == ProbabilisticBooleanModeStrict
     elif mode == ProbabilisticBooleanMode.MEDIUM:
-        return val in ProbabilisticBooleanModeMedium
+        return val in _PROBABILISTIC_BOOLEAN_MEDIUM
     elif mode == ProbabilisticBooleanMode.TOLERANT:
         # allow for probabilistic boolean / fault tolerance
-        return val in ProbabilisticBooleanModeTolerant
+        return val in _PROBABILISTIC_BOOLEAN_TOLERANT
     else:
         raise ValueError(f"Invalid mode {mode} for probabilistic boolean!")
 
 
+# return types which are cast from the engine response with ast.literal_eval
+_LITERAL_CONTAINER_TYPES = (list, tuple, set, dict)
+
+
 def _execute_query(engine, post_processors, return_constraint, argument) -> List[object]:
     # build prompt and query engine
     engine.prepare(argument)
@@ -74,18 +89,18 @@ def _execute_query(engine, post_processors, return_constraint, argument) -> List
             rsp             = pp(rsp, argument)
 
     # check if return type cast
+    # an exact type match is resolved by identity before building any string representations
     # compare string representation of return type to allow for generic duck typing of return types
-    if   str(return_constraint) == str(type(rsp)):
+    rsp_type                = type(rsp)
+    if   return_constraint is rsp_type or str(return_constraint) == str(rsp_type):
         pass
     # check if return type is list, tuple, set, dict, use ast.literal_eval to cast
-    elif return_constraint == list or \
-         return_constraint == tuple or \
-         return_constraint == set or \
-         return_constraint == dict:
+    elif return_constraint in _LITERAL_CONTAINER_TYPES:
         try:
             res = ast.literal_eval(rsp)
         except Exception as e:
-            logging.warn(f"Failed to cast return type to {return_constraint} for {str(rsp)}")
+            # format lazily, the response is only rendered if the warning is emitted
+            logging.warning("Failed to cast return type to %s for %s", return_constraint, rsp)
             res = rsp
         assert res is not None, "Return type cast failed! Check if the return type is correct or post_processors output matches desired format: " + str(rsp)
         rsp = res
@@ -110,6 +125,21 @@ def _execute_query(engine, post_processors, return_constraint, argument) -> List
     return rsp, metadata
 
 
+# signatures of the decorated functions are computed once and released with the function
+_SIGNATURES: "weakref.WeakKeyDictionary[Callable, inspect.Signature]" = weakref.WeakKeyDictionary()
+
+
+def _signature(func: Callable) -> inspect.Signature:
+    try:
+        sig = _SIGNATURES.get(func)
+        if sig is None:
+            sig = _SIGNATURES[func] = inspect.signature(func)
+    except TypeError:
+        # bound builtins, callables with __slots__ and unhashable callables cannot be weakly referenced
+        sig = inspect.signature(func)
+    return sig
+
+
 def _process_query(engine,
                    instance,
                    func:                Callable,
@@ -128,7 +158,7 @@ def _process_query(engine,
         post_processors             = [post_processors]
 
     # check signature for return type
-    sig                             = inspect.signature(func)
+    sig                             = _signature(func)
     return_constraint               = sig._return_annotation
     assert 'typing' not in str(return_constraint), "Return type must be of base type not generic Typing object, e.g. int, str, list, etc."
 
@@ -148,13 +178,13 @@ def _process_query(engine,
     # pre-process input with pre-processors
     processed_input               = ''
     if pre_processors and not argument.prop.raw_input:
-        for pp in pre_processors:
-            t                     = pp(argument)
-            processed_input      += t if t is not None else ''
+        # collect the pre-processed parts and join them once instead of concatenating per part
+        parts                     = [pp(argument) for pp in pre_processors]
+        processed_input           = ''.join([t for t in parts if t is not None])
     # if raw input, do not pre-process
     else:
         if argument.args and len(argument.args) > 0:
-            processed_input      += ' '.join([str(a) for a in argument.args])
+            processed_input       = ' '.join([str(a) for a in argument.args])
     # if not raw input, set processed input
     if not argument.prop.raw_input:
         argument.prop.processed_input = processed_input
@@ -175,7 +205,7 @@ def _process_query(engine,
                 return metadata.get('raw_output')
 
         except Exception as e:
-            logging.error(f"Failed to execute query: {str(e)}")
+            logging.error("Failed to execute query: %s", e)
             traceback.print_exc()
             if try_cnt < trials:
                 continue # repeat if query unsuccessful
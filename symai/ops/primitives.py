@@ -1,4 +1,5 @@
 import ast
+import operator
 import os
 import pickle
 import uuid
@@ -30,38 +31,419 @@ class Primitive:
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         # by default, disable shortcut matches and neuro-symbolic iterations
-        self.__disable_shortcut_matches__  = self.__disable_shortcut_matches__ or Primitive.__disable_shortcut_matches__
-        self.__nesy_iteration_primitives__ = self.__nesy_iteration_primitives__ or Primitive.__nesy_iteration_primitives__
-        self.__disable_nesy_engine__       = self.__disable_nesy_engine__ or Primitive.__disable_nesy_engine__
-        self.__disable_none_shortcut__     = self.__disable_none_shortcut__ or Primitive.__disable_none_shortcut__
+        # only shadow the class attributes if a flag got globally enabled on the Primitive base class
+        if not self.__disable_shortcut_matches__ and Primitive.__disable_shortcut_matches__:
+            self.__disable_shortcut_matches__  = True
+        if not self.__nesy_iteration_primitives__ and Primitive.__nesy_iteration_primitives__:
+            self.__nesy_iteration_primitives__ = True
+        if not self.__disable_nesy_engine__ and Primitive.__disable_nesy_engine__:
+            self.__disable_nesy_engine__       = True
+        if not self.__disable_none_shortcut__ and Primitive.__disable_none_shortcut__:
+            self.__disable_none_shortcut__     = True
 
     @staticmethod
     def _is_iterable(value):
         return isinstance(value, (list, tuple, set, dict, bytes, bytearray, range, torch.Tensor, np.ndarray))
 
 
+# plain numeric and array value types which are computed directly without casting the other operand to a symbol
+_NUMERIC_TYPES = frozenset({int, float, np.int64, np.float64, np.ndarray})
+
+
+# type specific value operations shared by all symbols instead of allocating a lambda per operator call
+def _value_neg(a, _):
+    return -a.value
+
+
+def _value_not(a, _):
+    return not a.value
+
+
+def _value_invert(a, _):
+    return ~a.value
+
+
+def _value_contains(a, b):
+    return b.value in a.value
+
+
+def _value_eq(a, b):
+    return a.value == b.value
+
+
+def _value_ne(a, b):
+    return a.value != b.value
+
+
+def _value_gt(a, b):
+    return a.value > b.value
+
+
+def _value_lt(a, b):
+    return a.value < b.value
+
+
+def _value_le(a, b):
+    return a.value <= b.value
+
+
+def _value_ge(a, b):
+    return a.value >= b.value
+
+
+def _value_lshift(a, b):
+    return a.value << b.value
+
+
+def _value_rlshift(a, b):
+    return b.value << a.value
+
+
+def _value_rshift(a, b):
+    return a.value >> b.value
+
+
+def _value_rrshift(a, b):
+    return b.value >> a.value
+
+
+def _value_add(a, b):
+    return a.value + b.value
+
+
+def _value_radd(a, b):
+    return b.value + a.value
+
+
+def _value_sub(a, b):
+    return a.value - b.value
+
+
+def _value_rsub(a, b):
+    return b.value - a.value
+
+
+def _value_and(a, b):
+    return a.value and b.value
+
+
+def _value_rand(a, b):
+    return b.value and a.value
+
+
+def _value_or(a, b):
+    return a.value or b.value
+
+
+def _value_bitor(a, b):
+    return a.value | b.value
+
+
+def _value_xor(a, b):
+    return a.value ^ b.value
+
+
+def _value_rxor(a, b):
+    return b.value ^ a.value
+
+
+def _value_matmul(a, b):
+    return a.value.__matmul__(b.value)
+
+
+def _value_rmatmul(a, b):
+    return a.value.__rmatmul__(b.value)
+
+
+def _value_imatmul(a, b):
+    return a.value.__imatmul__(b.value)
+
+
+def _value_truediv(a, b):
+    return a.value / b.value
+
+
+def _value_rtruediv(a, b):
+    return b.value / a.value
+
+
+def _value_floordiv(a, b):
+    return a.value // b.value
+
+
+def _value_rfloordiv(a, b):
+    return b.value // a.value
+
+
+def _value_pow(a, b):
+    return a.value ** b.value
+
+
+def _value_rpow(a, b):
+    return b.value ** a.value
+
+
+def _value_mod(a, b):
+    return a.value % b.value
+
+
+def _value_rmod(a, b):
+    return b.value % a.value
+
+
+def _value_mul(a, b):
+    return a.value * b.value
+
+
+def _value_rmul(a, b):
+    return b.value * a.value
+
+
+# docstrings of the generated arithmetic operators, keyed by the operation name
+_ARITHMETIC_DOC = '''
+        {} symbol value by another, splitting the symbol value by the other value.
+        The string representation of the other value is used to split the symbol value.
+
+        Args:
+            other (Any): The string to split the symbol value by.
+
+        Returns:
+            Symbol: A new symbol with the result of the division.
+        '''
+_ARITHMETIC_DOCS = {
+    'Division':       _ARITHMETIC_DOC.format('Divides the'),
+    'Floor division': _ARITHMETIC_DOC.format('Floor divides the'),
+    'Power':          _ARITHMETIC_DOC.format('Power operation on'),
+    'Modulo':         _ARITHMETIC_DOC.format('Modulo operation on'),
+    'Multiply':       _ARITHMETIC_DOC.format('Multiply operation on'),
+}
+
+
+# templates for the neuro-symbolic functions; the engine evaluates the return annotation to cast the result
+def _nesy_template(_, *args):
+    pass
+
+
+def _nesy_bool_template(_, *args) -> bool:
+    pass
+
+
+# neuro-symbolic operations with fixed decorator arguments, decorated once on first use
+# NOTE: `core` is not fully initialized while this module is imported, therefore the decorators are applied lazily
+_NESY_OP_FACTORIES = {
+    'contains': lambda: core.contains()(_nesy_bool_template),
+    'equals':   lambda: core.equals()(_nesy_bool_template),
+    '>':        lambda: core.compare(operator='>')(_nesy_bool_template),
+    '<':        lambda: core.compare(operator='<')(_nesy_bool_template),
+    '<=':       lambda: core.compare(operator='<=')(_nesy_bool_template),
+    '>=':       lambda: core.compare(operator='>=')(_nesy_bool_template),
+    'negate':   lambda: core.negate()(_nesy_template),
+    'invert':   lambda: core.invert()(_nesy_template),
+    'include':  lambda: core.include()(_nesy_template),
+    'combine':  lambda: core.combine()(_nesy_template),
+    'replace':  lambda: core.replace()(_nesy_template),
+    'and':      lambda: core.logic(operator='and')(_nesy_template),
+    'or':       lambda: core.logic(operator='or')(_nesy_template),
+    'xor':      lambda: core.logic(operator='xor')(_nesy_template),
+    'getitem':  lambda: core.getitem()(_nesy_template),
+    'setitem':  lambda: core.setitem()(_nesy_template),
+    'delitem':  lambda: core.delitem()(_nesy_template),
+}
+_NESY_OPS: Dict[str, Callable] = {}
+
+
+def _nesy_op(name: str) -> Callable:
+    '''
+    Get the decorated neuro-symbolic function of an operation and create it on first use.
+
+    Args:
+        name (str): The name of the operation as registered in `_NESY_OP_FACTORIES`.
+
+    Returns:
+        Callable: The decorated function which is called with the symbol instance as first argument.
+    '''
+    func = _NESY_OPS.get(name)
+    if func is None:
+        func = _NESY_OPS[name] = _NESY_OP_FACTORIES[name]()
+    return func
+
+
+# decorated functions of the primitive methods, keyed by method name
+_NESY_METHODS: Dict[str, Callable] = {}
+
+
+def _nesy_method(name: str, decorator: Callable, func: Callable, kwargs: Dict[str, Any]) -> Callable:
+    '''
+    Get the decorated function of a primitive method.
+    Calls without decorator kwargs reuse the function decorated on first use, calls with kwargs are decorated anew.
+
+    Args:
+        name (str): The name of the primitive method.
+        decorator (Callable): The decorator factory of the `core` module.
+        func (Callable): The template function to decorate.
+        kwargs (Dict[str, Any]): The decorator kwargs of the call.
+
+    Returns:
+        Callable: The decorated function which is called with the symbol instance as first argument.
+    '''
+    if kwargs:
+        return decorator(**kwargs)(func)
+    decorated = _NESY_METHODS.get(name)
+    if decorated is None:
+        decorated = _NESY_METHODS[name] = decorator()(func)
+    return decorated
+
+
+def _str_operands(value: Any, other: Any, symbol_type: Type) -> bool:
+    '''
+    Check if the value of a symbol and the other operand are both strings, including string subclasses.
+
+    Args:
+        value (Any): The value of the symbol.
+        other (Any): The other operand, either a raw value or a symbol.
+        symbol_type (Type): The symbol type used to unwrap the other operand.
+
+    Returns:
+        bool: True if both operands are strings, False otherwise.
+    '''
+    # exact type checks for plain strings first, subclasses such as np.str_ fall back to isinstance
+    if type(value) is not str and not isinstance(value, str):
+        return False
+    if type(other) is str or isinstance(other, str):
+        return True
+    if not isinstance(other, symbol_type):
+        return False
+    other = other.value
+    return type(other) is str or isinstance(other, str)
+
+
+# immutable literal value types which are returned as is when evaluated as literal
+_LITERAL_TYPES = frozenset({int, float, complex, bool, type(None)})
+
+
+# key types which are directly looked up in the builtin container value types
+_ITEM_KEY_TYPES = {
+    list:       frozenset({int, slice}),
+    tuple:      frozenset({int, slice}),
+    np.ndarray: frozenset({int, slice}),
+    dict:       frozenset({str, int}),
+}
+
+
+_AGGREGATOR_TYPE: Optional[Type] = None
+
+
+def _aggregator_type() -> Type:
+    '''
+    Get the Aggregator type and import it on first use to avoid the circular import with the symbol module.
+
+    Returns:
+        Type: The Aggregator type.
+    '''
+    global _AGGREGATOR_TYPE
+    if _AGGREGATOR_TYPE is None:
+        from ..collect.stats import Aggregator
+        _AGGREGATOR_TYPE = Aggregator
+    return _AGGREGATOR_TYPE
+
+
+# failures which a correction of the generated output cannot resolve and which are raised without retrying
+# NOTE: KeyboardInterrupt, SystemExit and cancellations are no subclasses of Exception and are never caught
+_NON_RETRYABLE_EXCEPTIONS = (MemoryError,)
+
+
+def _sum_products(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    '''
+    Sum the elementwise products of two embedding matrices over the embedding axis, without materializing the products for float64 embeddings.
+
+    Args:
+        a (np.ndarray): The first embedding matrix with the embedding dimension as first axis.
+        b (np.ndarray): The second embedding matrix, broadcastable against `a`.
+
+    Returns:
+        np.ndarray: The same result as `np.sum(a * b, axis=0)`.
+    '''
+    # einsum accumulates in the input dtype, np.sum upcasts small integers and sums float32 pairwise
+    if a.dtype == np.float64 and b.dtype == np.float64:
+        return np.einsum('i...,i...->...', a, b)
+    return np.sum(a * b, axis=0)
+
+
+def _squared_distance(v: np.ndarray, o: np.ndarray) -> np.ndarray:
+    '''
+    Compute the squared euclidean distance between embedding matrices with a single temporary for the difference.
+
+    Args:
+        v (np.ndarray): The first embedding matrix with the embedding dimension as first axis.
+        o (np.ndarray): The second embedding matrix, broadcastable against `v`.
+
+    Returns:
+        np.ndarray: The same result as `np.sum((v - o)**2, axis=0)`.
+    '''
+    d = v - o
+    return _sum_products(d, d)
+
+
+def _cosine(v: np.ndarray, o: np.ndarray, eps: float, normalized: bool = False) -> np.ndarray:
+    '''
+    Compute the cosine between embedding matrices over the embedding axis.
+
+    Args:
+        v (np.ndarray): The first embedding matrix with the embedding dimension as first axis.
+        o (np.ndarray): The second embedding matrix, broadcastable against `v`.
+        eps (float): A small value to avoid division by zero.
+        normalized (bool): Whether both embeddings have unit norm, which reduces the cosine to the inner product.
+
+    Returns:
+        np.ndarray: The cosine per column as a floating point array.
+    '''
+    cos = _sum_products(v, o)
+    if normalized:
+        # integer embeddings yield integer products, callers clip and take the arccos in place
+        return np.asarray(cos, dtype=np.result_type(cos.dtype, np.float32))
+    return cos / (np.sqrt(_sum_products(v, v)) * np.sqrt(_sum_products(o, o)) + eps)
+
+
+# direct conversions of raw embedding containers to numpy arrays, looked up by exact type
+_NUMPY_CONVERTERS: Dict[Type, Callable] = {
+    np.ndarray:   lambda x: x,
+    torch.Tensor: lambda x: x.detach().cpu().numpy()
+}
+
+
 class ArithmeticPrimitives(Primitive):
     def __try_type_specific_func(self, other, func, op: str = None):
         if self.__disable_shortcut_matches__:
             return None
-        if not isinstance(other, self._symbol_type):
+        symbol_type = self._symbol_type
+        if not isinstance(other, symbol_type):
             other = self._to_symbol(other)
         # None shortcut
         if not self.__disable_none_shortcut__:
             if  self.value is None or other.value is None:
-                raise TypeError(f"unsupported {self._symbol_type.__class__} value operand type(s) for {op}: '{type(self.value)}' and '{type(other.value)}'")
+                raise TypeError(f"unsupported {symbol_type.__class__} value operand type(s) for {op}: '{type(self.value)}' and '{type(other.value)}'")
         # try type specific function
         try:
-            # try type specific function
             value = func(self, other)
-            if value is NotImplemented:
-                operation = '' if op is None else op
-                raise TypeError(f"unsupported {self._symbol_type.__class__} value operand type(s) for {operation}: '{type(self.value)}' and '{type(other.value)}'")
-            return value
         except Exception as ex:
             self._metadata._error = ex
-            pass
-        return None
+            return None
+        if value is NotImplemented:
+            # record the error directly instead of raising and catching it again
+            operation = '' if op is None else op
+            self._metadata._error = TypeError(f"unsupported {symbol_type.__class__} value operand type(s) for {operation}: '{type(self.value)}' and '{type(other.value)}'")
+            return None
+        return value
+
+    def __numeric_operand(self, other):
+        '''
+        This function returns the raw value of the other operand if both operands hold plain numeric or array values, otherwise None.
+        '''
+        if self.__disable_shortcut_matches__ or type(self.value) not in _NUMERIC_TYPES:
+            return None
+        if isinstance(other, self._symbol_type):
+            other = other.value
+        return other if type(other) in _NUMERIC_TYPES else None
 
     def __throw_error_on_nesy_engine_call(self, func):
         '''
@@ -86,7 +468,7 @@ class ArithmeticPrimitives(Primitive):
             bool: True if the current Symbol contains the 'other' Symbol, otherwise False.
         '''
         # First verify for specific type support
-        result = self.__try_type_specific_func(other, lambda self, other: other.value in self.value, op='in')
+        result = self.__try_type_specific_func(other, _value_contains, op='in')
         # verify the result and return if found return
         if result is not None and result is not False:
             return result
@@ -107,11 +489,7 @@ class ArithmeticPrimitives(Primitive):
             return result
 
         self.__throw_error_on_nesy_engine_call(self.__contains__)
-
-        @core.contains()
-        def _func(_, other) -> bool:
-            pass
-
+        _func = _nesy_op('contains')
         return _func(self, other)
 
     def __eq__(self, other: Any) -> bool:
@@ -129,17 +507,13 @@ class ArithmeticPrimitives(Primitive):
         if self is other:
             return True
         # Then verify for specific type support
-        result = self.__try_type_specific_func(other, lambda self, other: self.value == other.value, op='==')
+        result = self.__try_type_specific_func(other, _value_eq, op='==')
         # verify the result and return if found return
         if result is not None and result is not False:
             return result
 
         self.__throw_error_on_nesy_engine_call(self.__eq__)
-
-        @core.equals()
-        def _func(_, other) -> bool:
-            pass
-
+        _func = _nesy_op('equals')
         return _func(self, other)
 
     def __ne__(self, other: Any) -> bool:
@@ -153,12 +527,19 @@ class ArithmeticPrimitives(Primitive):
         Returns:
             bool: True if the current Symbol is not equal to the 'other' Symbol, otherwise False.
         '''
-        # First verify for specific type support
-        result = self.__try_type_specific_func(other, lambda self, other:  self.value != other.value, op='!=')
-        # verify the result and return if found return
-        if result is not None and result is not False:
+        # First verify if not identical (same object)
+        if self is other:
+            return False
+        # Then verify for specific type support
+        result = self.__try_type_specific_func(other, _value_ne, op='!=')
+        # verify the result and return if found; a False result means the values are equal
+        if result is not None:
             return result
-        return not self.__eq__(other)
+
+        # the type specific check already failed, therefore skip it in __eq__ and negate the neuro-symbolic equality directly
+        self.__throw_error_on_nesy_engine_call(self.__ne__)
+        _func = _nesy_op('equals')
+        return not _func(self, other)
 
     def __gt__(self, other: Any) -> bool:
         '''
@@ -172,16 +553,13 @@ class ArithmeticPrimitives(Primitive):
             bool: True if the current Symbol is greater than the 'other' Symbol, otherwise False.
         '''
         # First verify for specific type support
-        result = self.__try_type_specific_func(other, lambda self, other: self.value > other.value, op='>')
+        result = self.__try_type_specific_func(other, _value_gt, op='>')
         # verify the result and return if found return
         if result is not None and result is not False:
             return result
 
         self.__throw_error_on_nesy_engine_call(self.__gt__)
-
-        @core.compare(operator = '>')
-        def _func(_, other) -> bool:
-            pass
+        _func = _nesy_op('>')
         return _func(self, other)
 
     def __lt__(self, other: Any) -> bool:
@@ -196,16 +574,13 @@ class ArithmeticPrimitives(Primitive):
             bool: True if the current Symbol is less than the 'other' Symbol, otherwise False.
         '''
         # First verify for specific type support
-        result = self.__try_type_specific_func(other, lambda self, other: self.value < other.value, op='<')
+        result = self.__try_type_specific_func(other, _value_lt, op='<')
         # verify the result and return if found return
         if result is not None and result is not False:
             return result
 
         self.__throw_error_on_nesy_engine_call(self.__lt__)
-
-        @core.compare(operator = '<')
-        def _func(_, other) -> bool:
-            pass
+        _func = _nesy_op('<')
         return _func(self, other)
 
     def __le__(self, other) -> bool:
@@ -220,16 +595,13 @@ class ArithmeticPrimitives(Primitive):
             bool: True if the current Symbol is less than or equal to the 'other' Symbol, otherwise False.
         '''
         # First verify for specific type support
-        result = self.__try_type_specific_func(other, lambda self, other: self.value <= other.value, op='<=')
+        result = self.__try_type_specific_func(other, _value_le, op='<=')
         # verify the result and return if found return
         if result is not None and result is not False:
             return result
 
         self.__throw_error_on_nesy_engine_call(self.__le__)
-
-        @core.compare(operator = '<=')
-        def _func(_, other) -> bool:
-            pass
+        _func = _nesy_op('<=')
         return _func(self, other)
 
     def __ge__(self, other) -> bool:
@@ -244,16 +616,13 @@ class ArithmeticPrimitives(Primitive):
             bool: True if the current Symbol is greater than or equal to the 'other' Symbol, otherwise False.
         '''
         # First verify for specific type support
-        result = self.__try_type_specific_func(other, lambda self, other: self.value >= other.value, op='>=')
+        result = self.__try_type_specific_func(other, _value_ge, op='>=')
         # verify the result and return if found return
         if result is not None and result is not False:
             return result
 
         self.__throw_error_on_nesy_engine_call(self.__ge__)
-
-        @core.compare(operator = '>=')
-        def _func(_, other) -> bool:
-            pass
+        _func = _nesy_op('>=')
         return _func(self, other)
 
     def __neg__(self) -> 'Symbol':
@@ -265,16 +634,13 @@ class ArithmeticPrimitives(Primitive):
             Symbol: The negated value of the Symbol.
         '''
         # First verify for specific type support
-        result = self.__try_type_specific_func(False, lambda self, _: -self.value, op='-')
+        result = self.__try_type_specific_func(False, _value_neg, op='-')
         # verify the result and return if found return
         if result is not None and result is not False:
             return self._to_symbol(result)
 
         self.__throw_error_on_nesy_engine_call(self.__neg__)
-
-        @core.negate()
-        def _func(_):
-            pass
+        _func = _nesy_op('negate')
         return self._to_symbol(_func(self))
 
     def __not__(self) -> 'Symbol':
@@ -286,16 +652,13 @@ class ArithmeticPrimitives(Primitive):
             Symbol: The negated value of the Symbol.
         '''
         # First verify for specific type support
-        result = self.__try_type_specific_func(False, lambda self, _: not self.value, op='not')
+        result = self.__try_type_specific_func(False, _value_not, op='not')
         # verify the result and return if found return
         if result is not None and result is not False:
             return self._to_symbol(result)
 
         self.__throw_error_on_nesy_engine_call(self.__not__)
-
-        @core.negate()
-        def _func(_):
-            pass
+        _func = _nesy_op('negate')
         return self._to_symbol(_func(self))
 
     def __invert__(self) -> 'Symbol':
@@ -307,16 +670,13 @@ class ArithmeticPrimitives(Primitive):
             Symbol: The inverted value of the Symbol.
         '''
         # First verify for specific type support
-        result = self.__try_type_specific_func(False, lambda self, _: ~self.value, op='~')
+        result = self.__try_type_specific_func(False, _value_invert, op='~')
         # verify the result and return if found return
         if result is not None and result is not False:
             return self._to_symbol(result)
 
         self.__throw_error_on_nesy_engine_call(self.__invert__)
-
-        @core.invert()
-        def _func(_):
-            pass
+        _func = _nesy_op('invert')
         return self._to_symbol(_func(self))
 
     def __lshift__(self, other: Any) -> 'Symbol':
@@ -331,16 +691,13 @@ class ArithmeticPrimitives(Primitive):
             Symbol: The Symbol with the new information included.
         '''
         # First verify for specific type support
-        result = self.__try_type_specific_func(other, lambda self, other: self.value << other.value, op='<<')
+        result = self.__try_type_specific_func(other, _value_lshift, op='<<')
         # verify the result and return if found return
         if result is not None and result is not False:
             return self._to_symbol(result)
 
         self.__throw_error_on_nesy_engine_call(self.__lshift__)
-
-        @core.include()
-        def _func(_, information: str):
-            pass
+        _func = _nesy_op('include')
         return self._to_symbol(_func(self, other))
 
     def __rlshift__(self, other: Any) -> 'Symbol':
@@ -355,16 +712,13 @@ class ArithmeticPrimitives(Primitive):
             Symbol: The Symbol with the new information included.
         '''
         # First verify for specific type support
-        result = self.__try_type_specific_func(other, lambda self, other: other.value << self.value, op='<<')
+        result = self.__try_type_specific_func(other, _value_rlshift, op='<<')
         # verify the result and return if found return
         if result is not None and result is not False:
             return self._to_symbol(result)
 
         self.__throw_error_on_nesy_engine_call(self.__rlshift__)
-
-        @core.include()
-        def _func(_, information: str):
-            pass
+        _func = _nesy_op('include')
         return self._to_symbol(_func(self, other))
 
     def __ilshift__(self, other: Any) -> 'Symbol':
@@ -379,17 +733,14 @@ class ArithmeticPrimitives(Primitive):
             Symbol: The Symbol with the new information included.
         '''
         # First verify for specific type support
-        result = self.__try_type_specific_func(other, lambda self, other: self.value << other.value, op='<<=')
+        result = self.__try_type_specific_func(other, _value_lshift, op='<<=')
         # verify the result and return if found return
         if result is not None and result is not False:
             self._value = result
             return self
 
         self.__throw_error_on_nesy_engine_call(self.__ilshift__)
-
-        @core.include()
-        def _func(_, information: str):
-            pass
+        _func = _nesy_op('include')
         self._value = _func(self, other)
         return self
 
@@ -405,16 +756,13 @@ class ArithmeticPrimitives(Primitive):
             Symbol: The Symbol with the new information included.
         '''
         # First verify for specific type support
-        result = self.__try_type_specific_func(other, lambda self, other: self.value >> other.value, op='>>')
+        result = self.__try_type_specific_func(other, _value_rshift, op='>>')
         # verify the result and return if found return
         if result is not None and result is not False:
             return self._to_symbol(result)
 
         self.__throw_error_on_nesy_engine_call(self.__rshift__)
-
-        @core.include()
-        def _func(_, information: str):
-            pass
+        _func = _nesy_op('include')
         return self._to_symbol(_func(self, other))
 
     def __rrshift__(self, other: Any) -> 'Symbol':
@@ -429,16 +777,13 @@ class ArithmeticPrimitives(Primitive):
             Symbol: The Symbol with the new information included.
         '''
         # First verify for specific type support
-        result = self.__try_type_specific_func(other, lambda self, other: other.value >> self.value, op='>>')
+        result = self.__try_type_specific_func(other, _value_rrshift, op='>>')
         # verify the result and return if found return
         if result is not None and result is not False:
             return self._to_symbol(result)
 
         self.__throw_error_on_nesy_engine_call(self.__rrshift__)
-
-        @core.include()
-        def _func(_, information: str):
-            pass
+        _func = _nesy_op('include')
         return self._to_symbol(_func(self, other))
 
     def __irshift__(self, other: Any) -> 'Symbol':
@@ -453,17 +798,14 @@ class ArithmeticPrimitives(Primitive):
             Symbol: The Symbol with the new information included.
         '''
         # First verify for specific type support
-        result = self.__try_type_specific_func(other, lambda self, other: self.value >> other.value, op='>>=')
+        result = self.__try_type_specific_func(other, _value_rshift, op='>>=')
         # verify the result and return if found return
         if result is not None and result is not False:
             self._value = result
             return self
 
         self.__throw_error_on_nesy_engine_call(self.__irshift__)
-
-        @core.include()
-        def _func(_, information: str):
-            pass
+        _func = _nesy_op('include')
         self._value = _func(self, other)
         return self
 
@@ -480,21 +822,17 @@ class ArithmeticPrimitives(Primitive):
             Symbol: The Symbol combined with the other value.
         '''
         # prefer nesy engine over type specific functions for str since the default string concatenation operator in SymbolicAI is '|'
-        if (isinstance(self.value, str) and isinstance(other, str)) or \
-            (isinstance(self.value, str) and isinstance(other, self._symbol_type) and isinstance(other.value, str)):
+        if _str_operands(self.value, other, self._symbol_type):
             result = None
         else:
             # Otherwise verify for specific type support
-            result = self.__try_type_specific_func(other, lambda self, other: self.value + other.value, op='+')
+            result = self.__try_type_specific_func(other, _value_add, op='+')
         # verify the result and return if found return
         if result is not None and result is not False:
             return self._to_symbol(result)
 
         self.__throw_error_on_nesy_engine_call(self.__add__)
-
-        @core.combine()
-        def _func(_, a: str, b: str):
-            pass
+        _func = _nesy_op('combine')
         return self._to_symbol(_func(self, other))
 
     def __radd__(self, other) -> 'Symbol':
@@ -510,21 +848,17 @@ class ArithmeticPrimitives(Primitive):
             Symbol: The other value combined with the Symbol.
         '''
         # prefer nesy engine over type specific functions for str since the default string concatenation operator in SymbolicAI is '|'
-        if (isinstance(self.value, str) and isinstance(other, str)) or \
-            (isinstance(self.value, str) and isinstance(other, self._symbol_type) and isinstance(other.value, str)):
+        if _str_operands(self.value, other, self._symbol_type):
             result = None
         else:
             # Otherwise verify for specific type support
-            result = self.__try_type_specific_func(other, lambda self, other: other.value + self.value, op='+')
+            result = self.__try_type_specific_func(other, _value_radd, op='+')
         # verify the result and return if found return
         if result is not None and result is not False:
             return self._to_symbol(result)
 
         self.__throw_error_on_nesy_engine_call(self.__radd__)
-
-        @core.combine()
-        def _func(_, a: str, b: str):
-            pass
+        _func = _nesy_op('combine')
         other = self._to_symbol(other)
         return self._to_symbol(_func(other, self))
 
@@ -540,12 +874,11 @@ class ArithmeticPrimitives(Primitive):
             Symbol: The updated Symbol with the added value.
         '''
         # prefer nesy engine over type specific functions for str since the default string concatenation operator in SymbolicAI is '|'
-        if (isinstance(self.value, str) and isinstance(other, str)) or \
-            (isinstance(self.value, str) and isinstance(other, self._symbol_type) and isinstance(other.value, str)):
+        if _str_operands(self.value, other, self._symbol_type):
             result = None
         else:
             # Otherwise verify for specific type support
-            result = self.__try_type_specific_func(other, lambda self, other: self.value + other.value, op='+=')
+            result = self.__try_type_specific_func(other, _value_add, op='+=')
         # verify the result and return if found return
         if result is not None and result is not False:
             self._value = result
@@ -567,16 +900,13 @@ class ArithmeticPrimitives(Primitive):
             Symbol: The Symbol with occurrences of the other value replaced with an empty string.
         '''
         # First verify for specific type support
-        result = self.__try_type_specific_func(other, lambda self, other: self.value - other.value, op='-')
+        result = self.__try_type_specific_func(other, _value_sub, op='-')
         # verify the result and return if found return
         if result is not None and result is not False:
             return self._to_symbol(result)
 
         self.__throw_error_on_nesy_engine_call(self.__sub__)
-
-        @core.replace()
-        def _func(_, text: str, replace: str, value: str):
-            pass
+        _func = _nesy_op('replace')
         return self._to_symbol(_func(self, other, ''))
 
     def __rsub__(self, other: Any) -> 'Symbol':
@@ -592,16 +922,13 @@ class ArithmeticPrimitives(Primitive):
             Symbol: A new symbol with the result of the subtraction.
         '''
         # First verify for specific type support
-        result = self.__try_type_specific_func(other, lambda self, other: other.value - self.value, op='-')
+        result = self.__try_type_specific_func(other, _value_rsub, op='-')
         # verify the result and return if found return
         if result is not None and result is not False:
             return self._to_symbol(result)
 
         self.__throw_error_on_nesy_engine_call(self.__rsub__)
-
-        @core.replace()
-        def _func(_, text: str, replace: str, value: str):
-            pass
+        _func = _nesy_op('replace')
         other = self._to_symbol(other)
         return self._to_symbol(_func(other, self, ''))
 
@@ -617,7 +944,7 @@ class ArithmeticPrimitives(Primitive):
             Symbol: The current symbol with the updated value.
         '''
         # First verify for specific type support
-        result = self.__try_type_specific_func(other, lambda self, other: self.value - other.value, op='-=')
+        result = self.__try_type_specific_func(other, _value_sub, op='-=')
         # verify the result and return if found return
         if result is not None and result is not False:
             self._value = result
@@ -641,22 +968,19 @@ class ArithmeticPrimitives(Primitive):
             Symbol: A new symbol with the result of the AND operation.
         '''
         # Special case for string concatenation with AND (no space)
-        if isinstance(self.value, str) and isinstance(other, str) or \
-            isinstance(self.value, str) and isinstance(other, self._symbol_type) and isinstance(other.value, str):
-            other = self._to_symbol(other)
-            return self._to_symbol(f'{self.value}{other.value}')
+        if _str_operands(self.value, other, self._symbol_type):
+            # read the string operand directly instead of casting it to a symbol
+            other_value = other if isinstance(other, str) else other.value
+            return self._to_symbol(f'{self.value}{other_value}')
 
         # First verify for specific type support
-        result = self.__try_type_specific_func(other, lambda self, other: self.value and other.value, op='&')
+        result = self.__try_type_specific_func(other, _value_and, op='&')
         # verify the result and return if found return
         if result is not None and result is not False:
             return result
 
         self.__throw_error_on_nesy_engine_call(self.__and__)
-
-        @core.logic(operator='and')
-        def _func(_, a: str, b: str):
-            pass
+        _func = _nesy_op('and')
         return self._to_symbol(_func(self, other))
 
     def __rand__(self, other: Any) -> Any:
@@ -674,23 +998,20 @@ class ArithmeticPrimitives(Primitive):
             Symbol: A new symbol with the result of the AND operation.
         '''
         # Special case for string concatenation with AND (no space)
-        if isinstance(self.value, str) and isinstance(other, str) or \
-            isinstance(self.value, str) and isinstance(other, self._symbol_type) and isinstance(other.value, str):
-            other = self._to_symbol(other)
-            return self._to_symbol(f'{other.value}{self.value}')
+        if _str_operands(self.value, other, self._symbol_type):
+            # read the string operand directly instead of casting it to a symbol
+            other_value = other if isinstance(other, str) else other.value
+            return self._to_symbol(f'{other_value}{self.value}')
 
         other = self._to_symbol(other)
         # First verify for specific type support
-        result = self.__try_type_specific_func(other, lambda self, other:  other.value and self.value, op='&')
+        result = self.__try_type_specific_func(other, _value_rand, op='&')
         # verify the result and return if found return
         if result is not None and result is not False:
             return result
 
         self.__throw_error_on_nesy_engine_call(self.__rand__)
-
-        @core.logic(operator='and')
-        def _func(_, a: str, b: str):
-            pass
+        _func = _nesy_op('and')
         other = self._to_symbol(other)
         return self._to_symbol(_func(other, self))
 
@@ -709,24 +1030,21 @@ class ArithmeticPrimitives(Primitive):
             Symbol: A new symbol with the result of the AND operation.
         '''
         # Special case for string concatenation with AND (no space)
-        if isinstance(self.value, str) and isinstance(other, str) or \
-            isinstance(self.value, str) and isinstance(other, self._symbol_type) and isinstance(other.value, str):
-            other       = self._to_symbol(other)
-            self._value = f'{self.value}{other.value}'
+        if _str_operands(self.value, other, self._symbol_type):
+            # read the string operand directly instead of casting it to a symbol
+            other_value = other if isinstance(other, str) else other.value
+            self._value = f'{self.value}{other_value}'
             return self
 
         # First verify for specific type support
-        result = self.__try_type_specific_func(other, lambda self, other: self.value and other.value, op='&=')
+        result = self.__try_type_specific_func(other, _value_and, op='&=')
         # verify the result and return if found return
         if result is not None and result is not False:
             self._value = result
             return self
 
         self.__throw_error_on_nesy_engine_call(self.__iand__)
-
-        @core.logic(operator='and')
-        def _func(_, a: str, b: str):
-            pass
+        _func = _nesy_op('and')
         self._value = _func(self, other)
         return self
 
@@ -745,27 +1063,23 @@ class ArithmeticPrimitives(Primitive):
             Symbol: A new symbol with the result of the OR operation.
         '''
         # exclude the evaluation for the Aggregator class
-        from ..collect.stats import Aggregator
-        if isinstance(other, Aggregator):
+        if isinstance(other, _aggregator_type()):
             return NotImplemented
 
         # Special case for string concatenation with OR
-        if isinstance(self.value, str) and isinstance(other, str) or \
-            isinstance(self.value, str) and isinstance(other, self._symbol_type) and isinstance(other.value, str):
-            other = self._to_symbol(other)
-            return self._to_symbol(f'{self.value} {other.value}')
+        if _str_operands(self.value, other, self._symbol_type):
+            # read the string operand directly instead of casting it to a symbol
+            other_value = other if isinstance(other, str) else other.value
+            return self._to_symbol(f'{self.value} {other_value}')
 
         # First verify for specific type support
-        result = self.__try_type_specific_func(other, lambda self, other: self.value or other.value, op='|')
+        result = self.__try_type_specific_func(other, _value_or, op='|')
         # verify the result and return if found return
         if result is not None and result is not False:
             return result
 
         self.__throw_error_on_nesy_engine_call(self.__or__)
-
-        @core.logic(operator='or')
-        def _func(_, a: str, b: str):
-            pass
+        _func = _nesy_op('or')
         return self._to_symbol(_func(self, other))
 
     def __ror__(self, other: Any) -> 'Symbol':
@@ -782,28 +1096,24 @@ class ArithmeticPrimitives(Primitive):
             Symbol: A new Symbol object with the concatenated value.
         '''
         # exclude the evaluation for the Aggregator class
-        from ..collect.stats import Aggregator
-        if isinstance(other, Aggregator):
+        if isinstance(other, _aggregator_type()):
             return NotImplemented
 
         if self.__disable_shortcut_matches__:
             # Special case for string concatenation with OR
-            if isinstance(self.value, str) and isinstance(other, str) or \
-                isinstance(self.value, str) and isinstance(other, self._symbol_type) and isinstance(other.value, str):
-                other = self._to_symbol(other)
-                return self._to_symbol(f'{other.value} {self.value}')
+            if _str_operands(self.value, other, self._symbol_type):
+                # read the string operand directly instead of casting it to a symbol
+                other_value = other if isinstance(other, str) else other.value
+                return self._to_symbol(f'{other_value} {self.value}')
 
         # First verify for specific type support
-        result = self.__try_type_specific_func(other, lambda self, other: self.value | other.value, op='|')
+        result = self.__try_type_specific_func(other, _value_bitor, op='|')
         # verify the result and return if found return
         if result is not None and result is not False:
             return self._to_symbol(result)
 
         self.__throw_error_on_nesy_engine_call(self.__ror__)
-
-        @core.logic(operator='or')
-        def _func(a: str, b: str):
-            pass
+        _func = _nesy_op('or')
         other = self._to_symbol(other)
         return self._to_symbol(_func(other, self))
 
@@ -821,20 +1131,19 @@ class ArithmeticPrimitives(Primitive):
             Symbol: A new Symbol object with the concatenated value.
         '''
         # exclude the evaluation for the Aggregator class
-        from ..collect.stats import Aggregator
-        if isinstance(other, Aggregator):
+        if isinstance(other, _aggregator_type()):
             return NotImplemented
 
         if self.__disable_shortcut_matches__:
             # Special case for string concatenation with OR
-            if isinstance(self.value, str) and isinstance(other, str) or \
-                isinstance(self.value, str) and isinstance(other, self._symbol_type) and isinstance(other.value, str):
-                other       = self._to_symbol(other)
-                self._value = f'{self.value} {other.value}'
+            if _str_operands(self.value, other, self._symbol_type):
+                # read the string operand directly instead of casting it to a symbol
+                other_value = other if isinstance(other, str) else other.value
+                self._value = f'{self.value} {other_value}'
                 return self
 
         # First verify for specific type support
-        result = self.__try_type_specific_func(other, lambda self, other: self.value | other.value, op='|=')
+        result = self.__try_type_specific_func(other, _value_bitor, op='|=')
         # verify the result and return if found return
         if result is not None and result is not False:
             self._value = result
@@ -842,10 +1151,7 @@ class ArithmeticPrimitives(Primitive):
         result = self._to_symbol(str(self) + str(other))
 
         self.__throw_error_on_nesy_engine_call(self.__ior__)
-
-        @core.logic(operator='or')
-        def _func(_, a: str, b: str):
-            pass
+        _func = _nesy_op('or')
         self._value = _func(self, other)
         return self
 
@@ -862,16 +1168,13 @@ class ArithmeticPrimitives(Primitive):
             Symbol: A new symbol with the result of the XOR operation.
         '''
         # First verify for specific type support
-        result = self.__try_type_specific_func(other, lambda self, other: self.value ^ other.value, op='^')
+        result = self.__try_type_specific_func(other, _value_xor, op='^')
         # verify the result and return if found return
         if result is not None and result is not False:
             return self._to_symbol(result)
 
         self.__throw_error_on_nesy_engine_call(self.__xor__)
-
-        @core.logic(operator='xor')
-        def _func(_, a: str, b: str):
-            pass
+        _func = _nesy_op('xor')
         return self._to_symbol(_func(self, other))
 
     def __rxor__(self, other: Any) -> 'Symbol':
@@ -887,16 +1190,13 @@ class ArithmeticPrimitives(Primitive):
             Symbol: A new symbol with the result of the XOR operation.
         '''
         # First verify for specific type support
-        result = self.__try_type_specific_func(other, lambda self, other: other.value ^ self.value, op='^')
+        result = self.__try_type_specific_func(other, _value_rxor, op='^')
         # verify the result and return if found return
         if result is not None and result is not False:
             return self._to_symbol(result)
 
         self.__throw_error_on_nesy_engine_call(self.__rxor__)
-
-        @core.logic(operator='xor')
-        def _func(_, a: str, b: str):
-            pass
+        _func = _nesy_op('xor')
         other = self._to_symbol(other)
         return self._to_symbol(_func(other, self))
 
@@ -913,17 +1213,14 @@ class ArithmeticPrimitives(Primitive):
             Symbol: A new symbol with the result of the XOR operation.
         '''
         # First verify for specific type support
-        result = self.__try_type_specific_func(other, lambda self, other: self.value ^ other.value, op='^=')
+        result = self.__try_type_specific_func(other, _value_xor, op='^=')
         # verify the result and return if found return
         if result is not None and result is not False:
             self._value = result
             return self
 
         self.__throw_error_on_nesy_engine_call(self.__ixor__)
-
-        @core.logic(operator='xor')
-        def _func(_, a: str, b: str):
-            pass
+        _func = _nesy_op('xor')
         self._value = _func(self, other)
         return self
 
@@ -939,7 +1236,7 @@ class ArithmeticPrimitives(Primitive):
             Symbol: A new Symbol object with the concatenated value.
         '''
         # First verify for specific type support
-        result = self.__try_type_specific_func(other, lambda self, other: self.value.__matmul__(other.value), op='@')
+        result = self.__try_type_specific_func(other, _value_matmul, op='@')
         # verify the result and return if found return
         if result is not None and result is not False:
             return self._to_symbol(result)
@@ -957,7 +1254,7 @@ class ArithmeticPrimitives(Primitive):
             Symbol: A new Symbol object with the concatenated value.
         '''
         # First verify for specific type support
-        result = self.__try_type_specific_func(other, lambda self, other:  self.value.__rmatmul__(other.value), op='@')
+        result = self.__try_type_specific_func(other, _value_rmatmul, op='@')
         # verify the result and return if found return
         if result is not None and result is not False:
             return self._to_symbol(result)
@@ -975,287 +1272,82 @@ class ArithmeticPrimitives(Primitive):
             Symbol: The current Symbol object with the concatenated value.
         '''
         # First verify for specific type support
-        result = self.__try_type_specific_func(other, lambda self, other: self.value.__imatmul__(other.value), op='@=')
+        result = self.__try_type_specific_func(other, _value_imatmul, op='@=')
         # verify the result and return if found return
         if result is not None and result is not False:
             self._value = result
             return self
         raise NotImplementedError('Matrix multiplication not supported! Might change in the future.') from self._metadata._error
 
-    def __truediv__(self, other: Any) -> 'Symbol':
-        '''
-        Divides the symbol value by another, splitting the symbol value by the other value.
-        The string representation of the other value is used to split the symbol value.
-
-        Args:
-            other (Any): The string to split the symbol value by.
-
-        Returns:
-            Symbol: A new symbol with the result of the division.
-        '''
-        # First verify for specific type support
-        result = self.__try_type_specific_func(other, lambda self, other: self.value / other.value, op='/')
-        # verify the result and return if found return
-        if result is not None and result is not False:
-            return self._to_symbol(result)
-        return self._to_symbol(str(self).split(str(other)))
-
-    def __rtruediv__(self, other: Any) -> 'Symbol':
-        '''
-        Divides the symbol value by another, splitting the symbol value by the other value.
-        The string representation of the other value is used to split the symbol value.
-
-        Args:
-            other (Any): The string to split the symbol value by.
-
-        Returns:
-            Symbol: A new symbol with the result of the division.
-        '''
-        # First verify for specific type support
-        result = self.__try_type_specific_func(other, lambda self, other: other.value / self.value, op='/')
-        # verify the result and return if found return
-        if result is not None and result is not False:
-            return self._to_symbol(result)
-        raise NotImplementedError('Division operation not supported! Might change in the future.') from self._metadata._error
-
-    def __itruediv__(self, other: Any) -> 'Symbol':
-        '''
-        Divides the symbol value by another, splitting the symbol value by the other value.
-        The string representation of the other value is used to split the symbol value.
-
-        Args:
-            other (Any): The string to split the symbol value by.
-
-        Returns:
-            Symbol: A new symbol with the result of the division.
-        '''
-        # First verify for specific type support
-        result = self.__try_type_specific_func(other, lambda self, other: self.value / other.value, op='/=')
-        # verify the result and return if found return
-        if result is not None and result is not False:
-            self._value = result
-            return self
-        raise NotImplementedError('Division operation not supported! Might change in the future.') from self._metadata._error
-
-    def __floordiv__(self, other: Any) -> 'Symbol':
-        '''
-        Floor divides the symbol value by another, splitting the symbol value by the other value.
-        The string representation of the other value is used to split the symbol value.
-
-        Args:
-            other (Any): The string to split the symbol value by.
-
-        Returns:
-            Symbol: A new symbol with the result of the division.
-        '''
-        # First verify for specific type support
-        result = self.__try_type_specific_func(other, lambda self, other: self.value // other.value, op='//')
-        # verify the result and return if found return
-        if result is not None and result is not False:
-            return self._to_symbol(result)
-        return self._to_symbol(str(self).split(str(other)))
-
-    def __rfloordiv__(self, other: Any) -> 'Symbol':
-        '''
-        Floor divides the symbol value by another, splitting the symbol value by the other value.
-        The string representation of the other value is used to split the symbol value.
-
-        Args:
-            other (Any): The string to split the symbol value by.
-
-        Returns:
-            Symbol: A new symbol with the result of the division.
-        '''
-        # First verify for specific type support
-        result = self.__try_type_specific_func(other, lambda self, other: other.value // self.value, op='//')
-        # verify the result and return if found return
-        if result is not None and result is not False:
-            return self._to_symbol(result)
-        raise NotImplementedError('Floor division operation not supported! Might change in the future.') from self._metadata._error
-
-    def __ifloordiv__(self, other: Any) -> 'Symbol':
-        '''
-        Floor divides the symbol value by another, splitting the symbol value by the other value.
-        The string representation of the other value is used to split the symbol value.
-
-        Args:
-            other (Any): The string to split the symbol value by.
-
-        Returns:
-            Symbol: A new symbol with the result of the division.
-        '''
-        # First verify for specific type support
-        result = self.__try_type_specific_func(other, lambda self, other: self.value // other.value, op='//=')
-        # verify the result and return if found return
-        if result is not None and result is not False:
-            self._value = result
-            return self
-        raise NotImplementedError('Floor division operation not supported! Might change in the future.') from self._metadata._error
-
-    def __pow__(self, other: Any) -> 'Symbol':
-        '''
-        Power operation on symbol value by another, splitting the symbol value by the other value.
-        The string representation of the other value is used to split the symbol value.
-
-        Args:
-            other (Any): The string to split the symbol value by.
-
-        Returns:
-            Symbol: A new symbol with the result of the division.
-        '''
-        # First verify for specific type support
-        result = self.__try_type_specific_func(other, lambda self, other: self.value ** other.value, op='**')
-        # verify the result and return if found return
-        if result is not None and result is not False:
-            return self._to_symbol(result)
-        raise NotImplementedError('Power operation not supported! Might change in the future.') from self._metadata._error
-
-    def __rpow__(self, other: Any) -> 'Symbol':
-        '''
-        Power operation on symbol value by another, splitting the symbol value by the other value.
-        The string representation of the other value is used to split the symbol value.
-
-        Args:
-            other (Any): The string to split the symbol value by.
-
-        Returns:
-            Symbol: A new symbol with the result of the division.
-        '''
-        # First verify for specific type support
-        result = self.__try_type_specific_func(other, lambda self, other: other.value ** self.value, op='**')
-        # verify the result and return if found return
-        if result is not None and result is not False:
-            return self._to_symbol(result)
-        raise NotImplementedError('Power operation not supported! Might change in the future.') from self._metadata._error
-
-    def __ipow__(self, other: Any) -> 'Symbol':
-        '''
-        Power operation on symbol value by another, splitting the symbol value by the other value.
-        The string representation of the other value is used to split the symbol value.
-
-        Args:
-            other (Any): The string to split the symbol value by.
-
-        Returns:
-            Symbol: A new symbol with the result of the division.
-        '''
-        # First verify for specific type support
-        result = self.__try_type_specific_func(other, lambda self, other: self.value ** other.value, op='**=')
-        # verify the result and return if found return
-        if result is not None and result is not False:
-            self._value = result
-            return self
-        raise NotImplementedError('Power operation not supported! Might change in the future.') from self._metadata._error
-
-    def __mod__(self, other: Any) -> 'Symbol':
-        '''
-        Modulo operation on symbol value by another, splitting the symbol value by the other value.
-        The string representation of the other value is used to split the symbol value.
-
-        Args:
-            other (Any): The string to split the symbol value by.
-
-        Returns:
-            Symbol: A new symbol with the result of the division.
-        '''
-        # First verify for specific type support
-        result = self.__try_type_specific_func(other, lambda self, other: self.value % other.value, op='%')
-        # verify the result and return if found return
-        if result is not None and result is not False:
-            return self._to_symbol(result)
-        raise NotImplementedError('Modulo operation not supported! Might change in the future.') from self._metadata._error
-
-    def __rmod__(self, other: Any) -> 'Symbol':
-        '''
-        Modulo operation on symbol value by another, splitting the symbol value by the other value.
-        The string representation of the other value is used to split the symbol value.
-
-        Args:
-            other (Any): The string to split the symbol value by.
-
-        Returns:
-            Symbol: A new symbol with the result of the division.
-        '''
-        # First verify for specific type support
-        result = self.__try_type_specific_func(other, lambda self, other: other.value % self.value, op='%')
-        # verify the result and return if found return
-        if result is not None and result is not False:
-            return self._to_symbol(result)
-        raise NotImplementedError('Modulo operation not supported! Might change in the future.') from self._metadata._error
-
-    def __imod__(self, other: Any) -> 'Symbol':
-        '''
-        Modulo operation on symbol value by another, splitting the symbol value by the other value.
-        The string representation of the other value is used to split the symbol value.
-
-        Args:
-            other (Any): The string to split the symbol value by.
-
-        Returns:
-            Symbol: A new symbol with the result of the division.
-        '''
-        # First verify for specific type support
-        result = self.__try_type_specific_func(other, lambda self, other: self.value % other.value, op='%=')
-        # verify the result and return if found return
-        if result is not None and result is not False:
-            self._value = result
-            return self
-        raise NotImplementedError('Modulo operation not supported! Might change in the future.') from self._metadata._error
-
-    def __mul__(self, other: Any) -> 'Symbol':
-        '''
-        Multiply operation on symbol value by another, splitting the symbol value by the other value.
-        The string representation of the other value is used to split the symbol value.
-
-        Args:
-            other (Any): The string to split the symbol value by.
-
-        Returns:
-            Symbol: A new symbol with the result of the division.
-        '''
-        # First verify for specific type support
-        result = self.__try_type_specific_func(other, lambda self, other: self.value * other.value, op='*')
-        # verify the result and return if found return
-        if result is not None and result is not False:
-            return self._to_symbol(result)
-        raise NotImplementedError('Multiply operation not supported! Might change in the future.') from self._metadata._error
-
-    def __rmul__(self, other: Any) -> 'Symbol':
-        '''
-        Multiply operation on symbol value by another, splitting the symbol value by the other value.
-        The string representation of the other value is used to split the symbol value.
-
-        Args:
-            other (Any): The string to split the symbol value by.
-
-        Returns:
-            Symbol: A new symbol with the result of the division.
-        '''
-        # First verify for specific type support
-        result = self.__try_type_specific_func(other, lambda self, other: other.value * self.value, op='*')
-        # verify the result and return if found return
-        if result is not None and result is not False:
-            return self._to_symbol(result)
-        raise NotImplementedError('Multiply operation not supported! Might change in the future.') from self._metadata._error
-
-    def __imul__(self, other: Any) -> 'Symbol':
-        '''
-        Multiply operation on symbol value by another, splitting the symbol value by the other value.
-        The string representation of the other value is used to split the symbol value.
-
-        Args:
-            other (Any): The string to split the symbol value by.
-
-        Returns:
-            Symbol: A new symbol with the result of the division.
-        '''
-        # First verify for specific type support
-        result = self.__try_type_specific_func(other, lambda self, other: self.value * other.value, op='*=')
-        # verify the result and return if found return
-        if result is not None and result is not False:
-            self._value = result
-            return self
-        raise NotImplementedError('Multiply operation not supported! Might change in the future.') from self._metadata._error
+    def __arithmetic_operator(op: str, value_func: Callable, native_func: Callable, name: str, reflected: bool = False, inplace: bool = False, split_fallback: bool = False) -> Callable:
+        '''
+        Create an arithmetic operator method once at class creation time.
+
+        Args:
+            op (str): The operator symbol used in error messages.
+            value_func (Callable): The type specific value operation used for the type specific dispatch.
+            native_func (Callable): The native operator function used for plain numeric and array values.
+            name (str): The name of the operation used in the not supported error message.
+            reflected (bool): Whether the operands are swapped. Defaults to False.
+            inplace (bool): Whether the symbol value is updated in place. Defaults to False.
+            split_fallback (bool): Whether to split the string representation of the symbol by the other value if the type specific dispatch fails. Defaults to False.
+
+        Returns:
+            Callable: The operator method.
+        '''
+        def _operator(self, other: Any) -> 'Symbol':
+            # fast path for plain numeric and array values without casting the operand to a symbol
+            other_value = self.__numeric_operand(other)
+            if other_value is not None:
+                try:
+                    result = native_func(other_value, self.value) if reflected else native_func(self.value, other_value)
+                except Exception:
+                    # fall back to the type specific function to record the error
+                    result = None
+                if result is not None:
+                    if inplace:
+                        self._value = result
+                        return self
+                    return self._to_symbol(result)
+            # verify for specific type support
+            result = self.__try_type_specific_func(other, value_func, op=op)
+            # verify the result and return if found return
+            if result is not None and result is not False:
+                if inplace:
+                    self._value = result
+                    return self
+                return self._to_symbol(result)
+            if split_fallback:
+                value = self.value
+                # split plain strings directly unless a subclass customizes its string representation
+                if type(value) is str and type(other) is str and type(self).__str__ is self._symbol_type.__str__:
+                    return self._to_symbol(value.split(other))
+                return self._to_symbol(str(self).split(str(other)))
+            raise NotImplementedError(f'{name} operation not supported! Might change in the future.') from self._metadata._error
+        # name the operator after the dunder it is assigned to, e.g. __rtruediv__ for a reflected operator.truediv
+        prefix                 = 'r' if reflected else 'i' if inplace else ''
+        _operator.__name__     = f'__{prefix}{native_func.__name__}__'
+        _operator.__qualname__ = f'ArithmeticPrimitives.{_operator.__name__}'
+        _operator.__doc__      = _ARITHMETIC_DOCS[name]
+        return _operator
+
+    # arithmetic operators are generated once instead of repeating the same dispatch for every operator
+    __truediv__   = __arithmetic_operator('/',   _value_truediv,   operator.truediv,  'Division', split_fallback=True)
+    __rtruediv__  = __arithmetic_operator('/',   _value_rtruediv,  operator.truediv,  'Division', reflected=True)
+    __itruediv__  = __arithmetic_operator('/=',  _value_truediv,   operator.truediv,  'Division', inplace=True)
+    __floordiv__  = __arithmetic_operator('//',  _value_floordiv,  operator.floordiv, 'Floor division', split_fallback=True)
+    __rfloordiv__ = __arithmetic_operator('//',  _value_rfloordiv, operator.floordiv, 'Floor division', reflected=True)
+    __ifloordiv__ = __arithmetic_operator('//=', _value_floordiv,  operator.floordiv, 'Floor division', inplace=True)
+    __pow__       = __arithmetic_operator('**',  _value_pow,       operator.pow,      'Power')
+    __rpow__      = __arithmetic_operator('**',  _value_rpow,      operator.pow,      'Power', reflected=True)
+    __ipow__      = __arithmetic_operator('**=', _value_pow,       operator.pow,      'Power', inplace=True)
+    __mod__       = __arithmetic_operator('%',   _value_mod,       operator.mod,      'Modulo')
+    __rmod__      = __arithmetic_operator('%',   _value_rmod,      operator.mod,      'Modulo', reflected=True)
+    __imod__      = __arithmetic_operator('%=',  _value_mod,       operator.mod,      'Modulo', inplace=True)
+    __mul__       = __arithmetic_operator('*',   _value_mul,       operator.mul,      'Multiply')
+    __rmul__      = __arithmetic_operator('*',   _value_rmul,      operator.mul,      'Multiply', reflected=True)
+    __imul__      = __arithmetic_operator('*=',  _value_mul,       operator.mul,      'Multiply', inplace=True)
+    del __arithmetic_operator
 
 
 class CastingPrimitives(Primitive):
@@ -1293,7 +1385,11 @@ class CastingPrimitives(Primitive):
         Returns:
             The abstract syntax tree representation of the Symbol's value.
         '''
-        return ast.literal_eval(str(self.value))
+        value = self.value
+        # immutable literal values evaluate to themselves and do not need to be serialized and parsed again
+        if type(value) in _LITERAL_TYPES:
+            return value
+        return ast.literal_eval(value if type(value) is str else str(value))
 
     def str(self) -> str:
         '''
@@ -1354,25 +1450,29 @@ class IterationPrimitives(Primitive):
         Raises:
             KeyError: If the key or index is not found in the Symbol value.
         '''
-        try:
-            if  (isinstance(key, int) or isinstance(key, slice)) and \
-                (isinstance(self.value, list) or \
-                 isinstance(self.value, tuple) or \
-                 isinstance(self.value, np.ndarray)):
-                return self.value[key]
-            elif (isinstance(key, str) or isinstance(key, int)) and \
-                  isinstance(self.value, dict):
-                return self.value[key]
-        except KeyError:
-            pass
+        value     = self.value
+        key_types = _ITEM_KEY_TYPES.get(type(value))
+        # fast path for the builtin container types without walking the isinstance chain
+        if key_types is not None and type(key) in key_types:
+            # check the dictionary membership instead of raising and catching a KeyError on a miss
+            if type(value) is not dict or key in value:
+                return value[key]
+        else:
+            try:
+                if  (isinstance(key, int) or isinstance(key, slice)) and \
+                    (isinstance(value, list) or \
+                     isinstance(value, tuple) or \
+                     isinstance(value, np.ndarray)):
+                    return value[key]
+                elif (isinstance(key, str) or isinstance(key, int)) and \
+                      isinstance(value, dict):
+                    return value[key]
+            except KeyError:
+                pass
         # verify if fuzzy matches are enabled in general
         if not self.__nesy_iteration_primitives__ or Primitive._is_iterable(self.value):
             raise KeyError(f'Key {key} not found in {self.value}')
-
-        @core.getitem()
-        def _func(_, index: str):
-            pass
-
+        _func = _nesy_op('getitem')
         return self._to_symbol(_func(self, key))
 
     def __setitem__(self, key: Union[str, int, slice], value: Any) -> None:
@@ -1389,6 +1489,11 @@ class IterationPrimitives(Primitive):
         Raises:
             KeyError: If the key or index is not found in the Symbol value.
         '''
+        # fast path for the builtin container types without walking the isinstance chain
+        key_types = _ITEM_KEY_TYPES.get(type(self.value))
+        if key_types is not None and type(key) in key_types:
+            self.value[key] = value
+            return
         try:
             if (isinstance(key, int) or isinstance(key, slice)) and (isinstance(self.value, list) or isinstance(self.value, tuple) or isinstance(self.value, np.ndarray)):
                 self.value[key] = value
@@ -1401,11 +1506,7 @@ class IterationPrimitives(Primitive):
 
         if not self.__nesy_iteration_primitives__ or Primitive._is_iterable(self.value):
             raise KeyError(f'Key {key} not found in {self.value}')
-
-        @core.setitem()
-        def _func(_, index: str, value: str):
-            pass
-
+        _func = _nesy_op('setitem')
         self._value = self._to_symbol(_func(self, key, value)).value
 
     def __delitem__(self, key: Union[str, int]) -> None:
@@ -1420,6 +1521,12 @@ class IterationPrimitives(Primitive):
         Raises:
             KeyError: If the key or index is not found in the Symbol value.
         '''
+        # check the membership of plain dictionaries instead of raising and catching a KeyError on a miss
+        if type(self.value) is dict and type(key) in _ITEM_KEY_TYPES[dict]:
+            if key not in self.value:
+                raise KeyError(f'Key {key} not found in {self.value}')
+            del self.value[key]
+            return
         try:
             if (isinstance(key, str) or isinstance(key, int)) and isinstance(self.value, dict):
                 del self.value[key]
@@ -1429,11 +1536,7 @@ class IterationPrimitives(Primitive):
 
         if not self.__nesy_iteration_primitives__ or Primitive._is_iterable(self.value):
             raise KeyError(f'Key {key} not found in {self.value}')
-
-        @core.delitem()
-        def _func(_, index: str):
-            pass
-
+        _func = _nesy_op('delitem')
         self._value = self._to_symbol(_func(self, key)).value
 
 
@@ -1505,9 +1608,9 @@ class ValueHandlingPrimitives(Primitive):
         Returns:
             Symbol: A new symbol with the index of the specified item.
         '''
-        @core.getitem(**kwargs)
         def _func(_, item: str) -> int:
             pass
+        _func = _nesy_method('index', core.getitem, _func, kwargs)
         return self._to_symbol(_func(self, item))
 
 
@@ -1528,8 +1631,9 @@ class StringHelperPrimitives(Primitive):
         '''
         assert isinstance(delimiter, str),  f'delimiter must be a string, got {type(delimiter)}'
         assert isinstance(self.value, str), f'self.value must be a string, got {type(self.value)}'
-        symbols = self.symbols(*self.value.split(delimiter))
-        return symbols
+        # create the symbols directly from the split list instead of unpacking it into an argument tuple
+        symbol_type = self._symbol_type
+        return [symbol_type(value) for value in self.value.split(delimiter)]
 
     def join(self, delimiter: str = ' ', **kwargs) -> 'Symbol':
         '''
@@ -1590,11 +1694,16 @@ class ComparisonPrimitives(Primitive):
 
         Args:
             string (str): The string to compare with the symbol value.
-            context (str, optional): The context in which to compare the strings. Defaults to 'contextually'.
+            context (str, optional): The context in which to compare the strings. Defaults to 'contextually'. 'exactly' compares the values natively.
 
         Returns:
             Symbol: A new symbol indicating whether the two strings are equal or not.
         '''
+        # exact comparisons are resolved natively without a neuro-symbolic engine call
+        if context == 'exactly' and not kwargs and not self.__disable_shortcut_matches__:
+            other = string.value if isinstance(string, self._symbol_type) else string
+            return self._to_symbol(self.value == other)
+
         @core.equals(context=context, **kwargs)
         def _func(_, string: str) -> bool:
             pass
@@ -1612,9 +1721,9 @@ class ComparisonPrimitives(Primitive):
         Returns:
             bool: True if the symbol's value contains the element, False otherwise.
         '''
-        @core.contains(**kwargs)
         def _func(_, other) -> bool:
             pass
+        _func = _nesy_method('contains', core.contains, _func, kwargs)
 
         return _func(self, element)
 
@@ -1629,9 +1738,9 @@ class ComparisonPrimitives(Primitive):
         Returns:
             bool: True if the current Symbol is an instance of the specified type, otherwise False.
         '''
-        @core.isinstanceof()
         def _func(_, query: str, **kwargs) -> bool:
             pass
+        _func = _nesy_method('isinstanceof', core.isinstanceof, _func, {})
 
         return _func(self, query, **kwargs)
 
@@ -1655,9 +1764,9 @@ class ExpressionHandlingPrimitives(Primitive):
         if expr is None:
             expr = self.value
 
-        @core.interpret(**kwargs)
         def _func(_, expr: str):
             pass
+        _func = _nesy_method('interpret', core.interpret, _func, kwargs)
 
         return self._to_symbol(_func(self, expr))
 
@@ -1675,9 +1784,9 @@ class DataHandlingPrimitives(Primitive):
         Returns:
             Symbol: A new symbol with the cleaned value.
         '''
-        @core.clean(**kwargs)
         def _func(_) -> str:
             pass
+        _func = _nesy_method('clean', core.clean, _func, kwargs)
 
         return self._to_symbol(_func(self))
 
@@ -1706,9 +1815,9 @@ class DataHandlingPrimitives(Primitive):
         Returns:
             Symbol: A new symbol with the outline of the value.
         '''
-        @core.outline(**kwargs)
         def _func(_) -> str:
             pass
+        _func = _nesy_method('outline', core.outline, _func, kwargs)
 
         return self._to_symbol(_func(self))
 
@@ -1759,9 +1868,9 @@ class DataHandlingPrimitives(Primitive):
         Returns:
             Symbol: A new symbol with the replaced value.
         '''
-        @core.replace(**kwargs)
         def _func(_, old: str, new: str):
             pass
+        _func = _nesy_method('replace', core.replace, _func, kwargs)
 
         return self._to_symbol(_func(self, old, new))
 
@@ -1776,9 +1885,9 @@ class DataHandlingPrimitives(Primitive):
         Returns:
             Symbol: A new symbol with the removed information.
         '''
-        @core.replace(**kwargs)
         def _func(_, text: str, replace: str, value: str):
             pass
+        _func = _nesy_method('remove', core.replace, _func, kwargs)
 
         return self._to_symbol(_func(self, information, ''))
 
@@ -1793,9 +1902,9 @@ class DataHandlingPrimitives(Primitive):
         Returns:
             Symbol: A new symbol with the included information.
         '''
-        @core.include(**kwargs)
         def _func(_, information: str):
             pass
+        _func = _nesy_method('include', core.include, _func, kwargs)
 
         return self._to_symbol(_func(self, information))
 
@@ -1810,9 +1919,9 @@ class DataHandlingPrimitives(Primitive):
         Returns:
             Symbol: A new symbol with the combined value.
         '''
-        @core.combine(**kwargs)
         def _func(_, a: str, b: str):
             pass
+        _func = _nesy_method('combine', core.combine, _func, kwargs)
 
         return self._to_symbol(_func(self, information))
 
@@ -1847,9 +1956,9 @@ class UniquenessPrimitives(Primitive):
         Returns:
             Symbol: A new symbol with the composed text.
         '''
-        @core.compose(**kwargs)
         def _func(_) -> str:
             pass
+        _func = _nesy_method('compose', core.compose, _func, kwargs)
 
         return self._to_symbol(_func(self))
 
@@ -1889,9 +1998,9 @@ class PatternMatchingPrimitives(Primitive):
         Returns:
             Symbol: A new symbol with the extracted data.
         '''
-        @core.extract(**kwargs)
         def _func(_, pattern: str) -> str:
             pass
+        _func = _nesy_method('extract', core.extract, _func, kwargs)
 
         return self._to_symbol(_func(self, pattern))
 
@@ -2045,9 +2154,9 @@ class ExecutionControlPrimitives(Primitive):
         Returns:
             Symbol: The result of the executed expression as a Symbol.
         '''
-        @core.execute(**kwargs)
         def _func(_):
             pass
+        _func = _nesy_method('execute', core.execute, _func, kwargs)
 
         return _func(self)
 
@@ -2076,9 +2185,9 @@ class ExecutionControlPrimitives(Primitive):
         Returns:
             Symbol: The simulated value as a Symbol.
         '''
-        @core.simulate(**kwargs)
         def _func(_):
             pass
+        _func = _nesy_method('simulate', core.simulate, _func, kwargs)
 
         return self._to_symbol(_func(self))
 
@@ -2154,16 +2263,20 @@ class ExecutionControlPrimitives(Primitive):
         @core_ext.bind(engine='neurosymbolic', property='max_tokens')
         def _max_tokens(_): pass
 
-        max_ctxt_tokens = int(_max_tokens(self) * token_ratio)
+        max_tokens      = _max_tokens(self)
+        max_ctxt_tokens = int(max_tokens * token_ratio)
         prev = expr(self, preview=True, **kwargs)
         prev = str(prev)
 
-        if len(prev) > _max_tokens(self):
+        if len(prev) > max_tokens:
             n_splits = (len(prev) // max_ctxt_tokens) + 1
+            # resolve the tokenizer and tokenize the value only once for all chunks
+            tokenizer = self.tokenizer()
+            tokens    = tokenizer.encode(str(self))
 
             for i in range(n_splits):
-                tokens_sliced = self.tokens[i * max_ctxt_tokens: (i + 1) * max_ctxt_tokens]
-                r = self._to_symbol(self.tokenizer().decode(tokens_sliced))
+                tokens_sliced = tokens[i * max_ctxt_tokens: (i + 1) * max_ctxt_tokens]
+                r = self._to_symbol(tokenizer.decode(tokens_sliced))
 
                 yield expr(r, **kwargs)
 
@@ -2200,6 +2313,9 @@ class ExecutionControlPrimitives(Primitive):
         if hasattr(expr, 'prompt'):
             prompt['prompt_instruction'] = expr.prompt
 
+        # the original prompt and input do not change between retries and are rendered on the first failure only
+        header = data = None
+
         sym = self # used for getting passed from one iteration to the next
         while True:
             try:
@@ -2210,16 +2326,17 @@ class ExecutionControlPrimitives(Primitive):
 
             except Exception as e:
                 retry_cnt += 1
-                if retry_cnt > retries:
+                if retry_cnt > retries or isinstance(e, _NON_RETRYABLE_EXCEPTIONS):
                     raise e
                 else:
+                    if data is None:
+                        header = f'[ORIGINAL_USER_PROMPT]\n{prompt["prompt_instruction"]}\n\n' if 'prompt_instruction' in prompt else ''
+                        data   = f'[ORIGINAL_USER_DATA]\n{code}\n\n'
                     # analyze the error
-                    payload = f'[ORIGINAL_USER_PROMPT]\n{prompt["prompt_instruction"]}\n\n' if 'prompt_instruction' in prompt else ''
-                    payload = payload + f'[ORIGINAL_USER_DATA]\n{code}\n\n[ORIGINAL_GENERATED_OUTPUT]\n{prompt["out_msg"]}'
+                    payload = f'{header}{data}[ORIGINAL_GENERATED_OUTPUT]\n{prompt["out_msg"]}'
                     probe   = sym.analyze(query="What is the issue in this expression?", payload=payload, exception=e)
                     # attempt to correct the error
-                    payload = f'[ORIGINAL_USER_PROMPT]\n{prompt["prompt_instruction"]}\n\n' if 'prompt_instruction' in prompt else ''
-                    payload = payload + f'[ANALYSIS]\n{probe}\n\n'
+                    payload = f'{header}[ANALYSIS]\n{probe}\n\n'
                     context = f'Try to correct the error of the original user request based on the analysis above: \n [GENERATED_OUTPUT]\n{prompt["out_msg"]}\n\n'
                     constraints = expr.constraints if hasattr(expr, 'constraints') else []
 
@@ -2383,8 +2500,9 @@ class EmbeddingPrimitives(Primitive):
         if not isinstance(value, list):
             # must convert to list of str for embedding
             value = [str(value)]
-        # ensure that all values are strings
-        value = [str(v) for v in value]
+        elif not all(type(v) is str for v in value):
+            # ensure that all values are strings
+            value = [str(v) for v in value]
 
         @core.embed(entries=value, **kwargs)
         def _func(_) -> list:
@@ -2400,50 +2518,68 @@ class EmbeddingPrimitives(Primitive):
         Returns:
             Any: The embedding of the symbol.
         '''
+        embedding = self._metadata.embedding
+        # a computed embedding is stored as numpy array and returned as is
+        if isinstance(embedding, np.ndarray):
+            return embedding
         # if the embedding is not yet computed, compute it
-        if self._metadata.embedding is None:
-            if ((isinstance(self.value, list) or isinstance(self.value, tuple)) and all([type(x) == int or type(x) == float or type(x) == bool for x in self.value])) \
-                or isinstance(self.value, np.ndarray):
-                if isinstance(self.value, list) or isinstance(self.value, tuple):
-                    assert len(self.value) > 0, 'Cannot compute embedding of empty list'
-                    if isinstance(self.value[0], Symbol):
+        if embedding is None:
+            value = self.value
+            if ((isinstance(value, list) or isinstance(value, tuple)) and all([type(x) == int or type(x) == float or type(x) == bool for x in value])) \
+                or isinstance(value, np.ndarray):
+                if isinstance(value, list) or isinstance(value, tuple):
+                    assert len(value) > 0, 'Cannot compute embedding of empty list'
+                    if isinstance(value[0], Symbol):
                         # convert each element to numpy array
-                        self._metadata.embedding = np.asarray([x.embedding for x in self.value])
-                    elif isinstance(self.value[0], str):
+                        embedding = np.asarray([x.embedding for x in value])
+                    elif isinstance(value[0], str):
                         # embed each string
-                        self._metadata.embedding = np.asarray([Symbol(x).embedding for x in self.value])
+                        embedding = np.asarray([Symbol(x).embedding for x in value])
                     else:
                         # convert to numpy array
-                        self._metadata.embedding = np.asarray(self.value)
+                        embedding = np.asarray(value)
                 else:
                     # convert to numpy array
-                    self._metadata.embedding = np.asarray(self.value)
-            elif isinstance(self.value, torch.Tensor):
-                self._metadata.embedding = self.value.detach().cpu().numpy()
+                    embedding = np.asarray(value)
+            elif isinstance(value, torch.Tensor):
+                embedding = value.detach().cpu().numpy()
             else:
                 # compute the embedding and store as numpy array
-                self._metadata.embedding = np.asarray(self.embed().value)
-        if isinstance(self._metadata.embedding, list):
-            self._metadata.embedding = np.asarray(self._metadata.embedding)
+                embedding = np.asarray(self.embed().value)
+            # remember the entries the embedding was computed for, the value may be changed in place afterwards
+            if isinstance(value, str):
+                self._metadata.embedding_source = (value,)
+            elif isinstance(value, list):
+                self._metadata.embedding_source = tuple(value)
+        elif isinstance(embedding, list):
+            embedding = np.asarray(embedding)
+        else:
+            return embedding
+        self._metadata.embedding = embedding
         # return the embedding
-        return self._metadata.embedding
+        return embedding
 
     def _ensure_numpy_format(self, x, cast=False):
-        # if it is a Symbol, get its value
-        if not isinstance(x, np.ndarray) or not isinstance(x, torch.Tensor) or not isinstance(x, list):
-            if not isinstance(x, self._symbol_type): #@NOTE: enforce Symbol to avoid circular import
-                if not cast:
-                    raise TypeError(f'Cannot compute similarity with type {type(x)}')
-                x = self._symbol_type(x)
-            # evaluate the Symbol as an embedding
-            x = x.embedding
-        # if it is a list, convert it to numpy
-        if isinstance(x, list) or isinstance(x, tuple):
-            assert len(x) > 0, 'Cannot compute similarity with empty list'
-            x = np.asarray(x)
-        # if it is a tensor, convert it to numpy
-        elif isinstance(x, torch.Tensor):
-            x = x.detach().cpu().numpy()
+        # arrays and tensors are converted directly instead of being wrapped into a Symbol first
+        convert = _NUMPY_CONVERTERS.get(type(x))
+        if convert is not None:
+            return convert(x).squeeze()[:, None]
+        # lists may hold strings which must be embedded, therefore they are evaluated as a Symbol
+        if not isinstance(x, self._symbol_type): #@NOTE: enforce Symbol to avoid circular import
+            if not cast:
+                raise TypeError(f'Cannot compute similarity with type {type(x)}')
+            x = self._symbol_type(x)
+        # evaluate the Symbol as an embedding
+        x = x.embedding
+        # embeddings are cached as numpy arrays, other containers are converted
+        if not isinstance(x, np.ndarray):
+            # if it is a list, convert it to numpy
+            if isinstance(x, list) or isinstance(x, tuple):
+                assert len(x) > 0, 'Cannot compute similarity with empty list'
+                x = np.asarray(x)
+            # if it is a tensor, convert it to numpy
+            elif isinstance(x, torch.Tensor):
+                x = x.detach().cpu().numpy()
         return x.squeeze()[:, None]
 
     def similarity(self, other: Union['Symbol', list, np.ndarray, torch.Tensor], metric: Union['cosine', 'angular-cosine', 'product', 'manhattan', 'euclidean', 'minkowski', 'jaccard'] = 'cosine', eps: float = 1e-8, normalize: Optional[Callable] = None, **kwargs) -> float:
@@ -2468,27 +2604,35 @@ class EmbeddingPrimitives(Primitive):
         '''
         v = self._ensure_numpy_format(self)
         if isinstance(other, list) or isinstance(other, tuple):
-            o = []
-            for i in range(len(other)):
-                o.append(self._ensure_numpy_format(other[i], cast=True))
-            o = np.concatenate(o, axis=1)
+            # the columns are views on the cached embeddings, so concatenate performs the only copy
+            o = np.concatenate([self._ensure_numpy_format(x, cast=True) for x in other], axis=1)
+        elif other is self:
+            # comparing the symbol with itself reuses its embedding
+            o = v
         else:
             o = self._ensure_numpy_format(other, cast=True)
 
         if   metric == 'cosine':
-            val     = v.T@o / (np.sqrt(v.T@v) * np.sqrt(o.T@o) + eps)
+            # normalize by the per column norms of o instead of the full o.T@o gram matrix
+            val     = v.T@o / (np.sqrt(v.T@v) * np.sqrt(np.einsum('ij,ij->j', o, o)) + eps)
         elif metric == 'angular-cosine':
             c       = kwargs.get('c', 1)
-            val     = 1 - (c * np.arccos((v.T@o / (np.sqrt(v.T@v) * np.sqrt(o.T@o) + eps))) / np.pi)
+            cos     = v.T@o / (np.sqrt(v.T@v) * np.sqrt(np.einsum('ij,ij->j', o, o)) + eps)
+            # rounding can push the cosine of (anti-)parallel vectors out of [-1, 1], where arccos is nan
+            val     = 1 - (c * np.arccos(np.clip(cos, -1.0, 1.0, out=cos), out=cos) / np.pi)
         elif metric == 'product':
             val     = v.T@o
         elif metric == 'manhattan':
-            val     = np.abs(v - o).sum(axis=0, keepdims=True)
+            # the difference is a fresh array and takes the absolute values in place
+            d       = v - o
+            val     = np.abs(d, out=d).sum(axis=0, keepdims=True)
         elif metric == 'euclidean':
-            val     = np.sqrt(np.sum((v - o)**2, axis=0, keepdims=True))
+            # reduce the squared differences per column without materializing them
+            val     = np.sqrt(_squared_distance(v, o))[None]
         elif metric == 'minkowski':
             p       = kwargs.get('p', 3)
-            val     = np.sum(np.abs(v - o)**p, axis=0, keepdims=True)**(1/p)
+            d       = v - o
+            val     = np.sum(np.abs(d, out=d)**p, axis=0, keepdims=True)**(1/p)
         elif metric == 'jaccard':
             intersection = np.minimum(v, o)
             union = np.maximum(v, o)
@@ -2516,8 +2660,10 @@ class EmbeddingPrimitives(Primitive):
         Args:
             other (Symbol): The other Symbol object to calculate the kernel with.
             kernel (Optional[str]): The function to use for calculating the kernel. Defaults to 'gaussian'.
+            eps (float): A small value to avoid division by zero.
             normalize (Optional[Callable]): A function to normalize the Symbol's value before calculating the kernel. Defaults to None.
-            **kwargs: Additional keyword arguments for the kernel arguments (e.g. gamma, coef).
+            **kwargs: Additional keyword arguments for the kernel arguments (e.g. gamma, coef, normalized).
+                normalized (bool): Whether both embeddings already have unit norm for the 'cosine' and 'angular-cosine' kernels, which skips computing the norms. Defaults to False.
 
         Returns:
             float: The kernel value between the two Symbol objects.
@@ -2528,59 +2674,63 @@ class EmbeddingPrimitives(Primitive):
         '''
         v = self._ensure_numpy_format(self)
         if isinstance(other, list) or isinstance(other, tuple):
-            o = []
-            for i in range(len(other)):
-                o.append(self._ensure_numpy_format(other[i], cast=True))
-            o = np.concatenate(o, axis=1)
+            # the columns are views on the cached embeddings, so concatenate performs the only copy
+            o = np.concatenate([self._ensure_numpy_format(x, cast=True) for x in other], axis=1)
+        elif other is self:
+            # comparing the symbol with itself reuses its embedding
+            o = v
         else:
             o = self._ensure_numpy_format(other, cast=True)
 
         # compute the kernel value
         if   kernel == 'gaussian':
             gamma   = kwargs.get('gamma', 1)
-            val     = np.exp(-gamma * np.sum((v - o)**2, axis=0))
+            val     = np.exp(-gamma * _squared_distance(v, o))
         elif kernel == 'rbf':
             # vectors are expected to be normalized
             bandwidth = kwargs.get('bandwidth', None)
             gamma     = kwargs.get('gamma', 1)
-            d         = np.sum((v - o)**2, axis=0)
+            d         = _squared_distance(v, o)
             if bandwidth is not None:
-                val   = 0
-                for a in bandwidth:
-                    gamma = 1.0 / (2 * a)
-                    val  += np.exp(-gamma * d)
+                # evaluate all bandwidths in one broadcasted exp over a (len(bandwidth), *d.shape) block
+                gamma = 1.0 / (2 * np.asarray(bandwidth, dtype=np.result_type(d.dtype, np.float32)))
+                val   = np.exp(-gamma.reshape((-1,) + (1,) * d.ndim) * d).sum(axis=0)
             else:
                 # if no bandwidth is given, default to the gaussian kernel
                 val = np.exp(-gamma * d)
         elif kernel == 'laplacian':
             gamma   = kwargs.get('gamma', 1)
-            val     = np.exp(-gamma * np.sum(np.abs(v - o), axis=0))
+            d       = v - o
+            val     = np.exp(-gamma * np.sum(np.abs(d, out=d), axis=0))
         elif kernel == 'polynomial':
             gamma   = kwargs.get('gamma', 1)
             degree  = kwargs.get('degree', 3)
             coef    = kwargs.get('coef', 1)
-            val     = (gamma * np.sum((v * o), axis=0) + coef)**degree
+            val     = (gamma * _sum_products(v, o) + coef)**degree
         elif kernel == 'sigmoid':
             gamma   = kwargs.get('gamma', 1)
             coef    = kwargs.get('coef', 1)
-            val     = np.tanh(gamma * np.sum((v * o), axis=0) + coef)
+            val     = np.tanh(gamma * _sum_products(v, o) + coef)
         elif kernel == 'linear':
-            val     = np.sum((v * o), axis=0)
+            val     = _sum_products(v, o)
         elif kernel == 'cauchy':
             gamma   = kwargs.get('gamma', 1)
-            val     = 1 / (1 + np.sum((v - o)**2, axis=0) / gamma)
+            val     = 1 / (1 + _squared_distance(v, o) / gamma)
         elif kernel == 't-distribution':
             gamma   = kwargs.get('gamma', 1)
             degree  = kwargs.get('degree', 1)
-            val     = 1 / (1 + (np.sum((v - o)**2, axis=0) / (gamma * degree))**(degree + 1) / 2)
+            val     = 1 / (1 + (_squared_distance(v, o) / (gamma * degree))**(degree + 1) / 2)
         elif kernel == 'inverse-multiquadric':
             gamma   = kwargs.get('gamma', 1)
-            val     = 1 / np.sqrt(np.sum((v - o)**2, axis=0) / gamma**2 + 1)
+            val     = 1 / np.sqrt(_squared_distance(v, o) / gamma**2 + 1)
         elif kernel == 'cosine':
-            val     = 1 - (np.sum(v * o, axis=0) / (np.sqrt(np.sum(v**2, axis=0)) * np.sqrt(np.sum(o**2, axis=0)) + eps))
+            # unit norm embeddings can skip the norms with normalized=True
+            val     = 1 - _cosine(v, o, eps, normalized=kwargs.get('normalized', False))
         elif kernel == 'angular-cosine':
             c       = kwargs.get('c', 1)
-            val     = c * np.arccos((np.sum(v * o, axis=0) / (np.sqrt(np.sum(v**2, axis=0)) * np.sqrt(np.sum(o**2, axis=0)) + eps))) / np.pi
+            cos     = _cosine(v, o, eps, normalized=kwargs.get('normalized', False))
+            # rounding can push the cosine of (anti-)parallel vectors out of [-1, 1], where arccos is nan
+            val     = c * np.arccos(np.clip(cos, -1.0, 1.0, out=cos), out=cos) / np.pi
         elif kernel == 'frechet':
             sigma1  = kwargs.get('sigma1', None)
             sigma2  = kwargs.get('sigma2', None)
@@ -2594,10 +2744,8 @@ class EmbeddingPrimitives(Primitive):
             val     = calculate_mmd(v, o, eps=eps)
         else:
             raise NotImplementedError(f"Kernel function {kernel} not implemented. Available functions: 'gaussian'")
-        # get the kernel value(s)
-        if len(val.shape) >= 1 and val.shape[0] > 1:
-            val = val
-        else:
+        # get the kernel value(s), a single value is returned as python scalar
+        if val.ndim == 0 or val.shape[0] <= 1:
             val = val.item()
 
         if normalize is not None:
@@ -2626,15 +2774,23 @@ class EmbeddingPrimitives(Primitive):
         else:
             raise ValueError(f'Expected id to be a string, got {type(self.value)}')
 
-        embeds = self.embed(**kwargs).value
-        idx    = [str(uuid.uuid4()) for _ in range(len(self.value))]
-        query  = [{'text': str(self.value[i])} for i in range(len(self.value))]
+        value     = self.value
+        embedding = self._metadata.embedding
+        source    = self._metadata.embedding_source
+        # reuse an embedding which was already computed for the same string entries instead of querying the engine again
+        # entries changed in place after the embedding was computed no longer match its source and are embedded again
+        if not kwargs and isinstance(embedding, np.ndarray) and source is not None and len(embedding) == len(value) \
+            and all(type(v) is str for v in value) and source == tuple(value):
+            embeds = embedding
+        else:
+            embeds = self.embed(**kwargs).value
+        idx    = [str(uuid.uuid4()) for _ in range(len(value))]
+        query  = [{'text': str(v)} for v in value]
 
         # convert embeds to list if it is a tensor or numpy array
-        if type(embeds) == np.ndarray:
+        # both convert to nested python lists directly, a tensor needs no detour through numpy
+        if type(embeds) == np.ndarray or type(embeds) == torch.Tensor:
             embeds = embeds.tolist()
-        elif type(embeds) == torch.Tensor:
-            embeds = embeds.cpu().numpy().tolist()
 
         return list(zip(idx, embeds, query))
 
@@ -2666,9 +2822,9 @@ class IOHandlingPrimitives(Primitive):
 
         # Works identically for the `Expression` class
         '''
-        @core.userinput(**kwargs)
         def _func(_, message) -> str:
             pass
+        _func = _nesy_method('input', core.userinput, _func, kwargs)
 
         res = _func(self, message)
         condition = self.value is not None and isinstance(self.value, str)
@@ -2790,8 +2946,8 @@ class PersistencePrimitives(Primitive):
         Returns:
             Symbol: The name of the newly created sub-component.
         '''
-        @core.expand(**kwargs)
         def _func(_, *args): pass
+        _func = _nesy_method('expand', core.expand, _func, kwargs)
 
         _tmp_llm_func = self._to_symbol(_func(self, *args))
         func_name = str(_tmp_llm_func.extract('function name'))
@@ -2821,8 +2977,9 @@ class PersistencePrimitives(Primitive):
 
         if not replace:
             cnt = 0
+            # the first free suffix is probed, the base name is split only once
+            filename, file_extension = os.path.splitext(path)
             while os.path.exists(file_path):
-                filename, file_extension = os.path.splitext(path)
                 file_path = f'{filename}_{cnt}{file_extension}'
                 cnt += 1
 
@@ -2830,7 +2987,10 @@ class PersistencePrimitives(Primitive):
             # serialize the object via pickle instead of writing the string
             path_ = str(file_path) + '.pkl' if not str(file_path).endswith('.pkl') else str(file_path)
             with open(path_, 'wb') as f:
-                pickle.dump(self, file=f)
+                # only the value and the creation kwargs are pickled, __getstate__ drops the metadata with its embeddings
+                # protocol 5 writes array values from their buffer instead of copying them to bytes first
+                # it is pinned instead of HIGHEST_PROTOCOL to keep the files readable on all supported python versions
+                pickle.dump(self, file=f, protocol=5)
         else:
             with open(str(file_path), 'w') as f:
                 f.write(str(self))
@@ -2846,7 +3006,9 @@ class PersistencePrimitives(Primitive):
         Returns:
             Symbol: The loaded Symbol.
         '''
-        with open(path, 'rb') as f:
+        # read in large blocks, large array or text values are unpickled with fewer read calls
+        # saved symbols hold no embeddings, __getstate__ drops the metadata before pickling
+        with open(path, 'rb', buffering=1 << 20) as f:
             obj = pickle.load(f)
         return obj
 
@@ -2867,9 +3029,9 @@ class OutputHandlingPrimitives(Primitive):
         Returns:
             Symbol: The resulting Symbol after the output operation.
         '''
-        @core.output(**kwargs)
         def _func(_, *args):
             pass
+        _func = _nesy_method('output', core.output, _func, kwargs)
 
         return self._to_symbol(_func(self, *args))
 
@@ -2902,19 +3064,20 @@ class FineTuningPrimitives(Primitive):
         Returns:
             Any: The data of the symbol.
         '''
+        data = self._metadata.data
         # if the data is not yet computed, compute it
-        if self._metadata.data is None:
+        if data is None:
             # compute the data and store as numpy array
-            self._metadata.data = self.embedding
+            data = self._metadata.data = self.embedding
         # if the data is a tensor, return it
-        if isinstance(self._metadata.data, torch.Tensor):
+        if isinstance(data, torch.Tensor):
             # return tensor
-            return self._metadata.data
+            return data
         # if the data is a numpy array, convert it to tensor
-        elif isinstance(self._metadata.data, np.ndarray):
+        elif isinstance(data, np.ndarray):
             # convert to tensor
-            self._metadata.data = torch.from_numpy(self._metadata.data)
-            return self._metadata.data
+            data = self._metadata.data = torch.from_numpy(data)
+            return data
         else:
-            raise TypeError(f'Expected data to be a tensor or numpy array, got {type(self._metadata.data)}')
+            raise TypeError(f'Expected data to be a tensor or numpy array, got {type(data)}')
 
@@ -1,4 +1,5 @@
 import ast
+import json
 import re
 import numpy as np
 
@@ -12,6 +13,74 @@ class PostProcessor:
         raise NotImplementedError()
 
 
+_FIRST_NON_SPACE = re.compile(r'\S')
+_CODE_BLOCK      = re.compile(r'```(?:\w*\n)?(.*?)```', re.DOTALL)
+_TRAILING_COMMA  = re.compile(r',(\s*[}\]])')
+
+
+def _strip_trailing_commas(response: str) -> str:
+    # drop commas which only precede a closing bracket, commas inside string literals are kept
+    drop      = []
+    comma     = -1
+    in_string = False
+    escaped   = False
+    for idx, char in enumerate(response):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+            comma     = -1
+        elif char == ',':
+            comma = idx
+        elif char in '}]':
+            if comma >= 0:
+                drop.append(comma)
+            comma = -1
+        elif not char.isspace():
+            comma = -1
+    if len(drop) <= 0:
+        return response
+    parts = []
+    start = 0
+    for idx in drop:
+        parts.append(response[start:idx])
+        start = idx + 1
+    parts.append(response[start:])
+    return ''.join(parts)
+
+
+def _truncate_json(response: str) -> str:
+    # cut off everything until the first '{' and after the last '}' with a single slice
+    # an already truncated json response is returned as is without copying it
+    start_idx = response.find('{')
+    if start_idx < 0:
+        start_idx = max(len(response) - 1, 0)
+    end_idx   = response.rfind('}', start_idx) + 1
+    response  = response[start_idx:end_idx] if end_idx > 0 else ''
+    # search after the first character of '{' if it is a '"' and if not, replace it
+    match     = _FIRST_NON_SPACE.search(response, 1)
+    if match is not None and match.group() == "'":
+        response = response.replace("'", '"')
+    # repair trailing commas deterministically instead of spending a retry on the engine
+    # responses which already parse, or still do not parse after the repair, are left as they are
+    if _TRAILING_COMMA.search(response) is not None:
+        try:
+            json.loads(response)
+        except json.JSONDecodeError:
+            repaired = _strip_trailing_commas(response)
+            try:
+                json.loads(repaired)
+                response = repaired
+            except json.JSONDecodeError:
+                pass
+    return response
+
+
 class StripPostProcessor(PostProcessor):
     def __call__(self, response, argument) -> Any:
         if response is None:
@@ -57,19 +126,7 @@ class JsonTruncatePostProcessor(PostProcessor):
         count_e = response.count('[JSON_END]')
         if count_b > 1 or count_e > 1:
             raise ValueError("More than one [JSON_BEGIN] or [JSON_END] found. Please only generate one JSON response.")
-        # cut off everything until the first '{'
-        start_idx = response.find('{')
-        response = response[start_idx:]
-        # find the first occurence of '}' looking backwards
-        end_idx = response.rfind('}') + 1
-        response = response[:end_idx]
-        # search after the first character of '{' if it is a '"' and if not, replace it
-        try:
-            if response[1:].strip()[0] == "'":
-                response = response.replace("'", '"')
-        except IndexError:
-            pass
-        return response
+        return _truncate_json(response)
 
 
 class JsonTruncateMarkdownPostProcessor(PostProcessor):
@@ -78,32 +135,22 @@ class JsonTruncateMarkdownPostProcessor(PostProcessor):
         count_e = response.count('```')
         if count_b > 1 or count_e > 2:
             raise ValueError("More than one ```json Markdown found. Please only generate one JSON response.")
-        # cut off everything until the first '{'
-        start_idx = response.find('{')
-        response = response[start_idx:]
-        # find the first occurence of '}' looking backwards
-        end_idx = response.rfind('}') + 1
-        response = response[:end_idx]
-        # search after the first character of '{' if it is a '"' and if not, replace it
-        try:
-            if response[1:].strip()[0] == "'":
-                response = response.replace("'", '"')
-        except IndexError:
-            pass
-        return response
+        return _truncate_json(response)
 
 
 class CodeExtractPostProcessor(PostProcessor):
     def __call__(self, response, argument, tag=None, **kwargs) -> Any:
-        if '```' not in str(response):
+        text = str(response)
+        if '```' not in text:
             return response
         matches = []
         try:
             if tag is None:
-                pattern = r'```(?:\w*\n)?(.*?)```'
+                # untagged extraction is the common case and uses the precompiled pattern
+                matches = _CODE_BLOCK.findall(text)
             else:
                 pattern = r'```(?:\w*\n)?' + str(tag) + r'\n(.*?)```'
-            matches = re.findall(pattern, str(response), re.DOTALL)
+                matches = re.findall(pattern, text, re.DOTALL)
         except IndexError:
             pass
         code = "\n".join(matches).strip()
@@ -130,9 +177,9 @@ class WolframAlphaPostProcessor(PostProcessor):
 class SplitPipePostProcessor(PostProcessor):
     def __call__(self, response, argument) -> Any:
         tmp = response if isinstance(response, list) else [response]
-        tmp = [r.split('|') for r in tmp if len(r.strip()) > 0]
-        tmp = sum(tmp, [])
-        return [t.strip() for t in tmp if len(t.strip()) > 0]
+        # flatten and strip the split parts in one pass instead of concatenating the split lists with sum
+        tmp = [t.strip() for r in tmp if len(r.strip()) > 0 for t in r.split('|')]
+        return [t for t in tmp if len(t) > 0]
 
 
 class NotifySubscriberPostProcessor(PostProcessor):
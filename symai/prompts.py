@@ -38,9 +38,9 @@ class Prompt(ABC):
         return self.value
 
     def __str__(self) -> str:
-        val_ = '\n'.join([str(p) for p in self.value])
-        for p in self.dynamic_value:
-            val_ += f'\n{p}'
+        # join the dynamic values at once instead of concatenating each of them
+        # every dynamic value is preceded by a newline, even if there are no static values
+        val_ = '\n'.join([str(p) for p in self.value]) + ''.join([f'\n{p}' for p in self.dynamic_value])
         if len(self.format_kwargs) > 0:
             for k, v in self.format_kwargs.items():
                 template_ = '{'+k+'}'
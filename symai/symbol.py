@@ -1,6 +1,7 @@
 import json
 import copy
 import html
+import weakref
 import numpy as np
 
 from box import Box
@@ -200,6 +201,8 @@ class Symbol(metaclass=SymbolMeta):
     _metadata             = Metadata()
     _metadata._primitives = {}
     _dynamic_context: Dict[str, List[str]] = {}
+    # mixin types are only kept alive by their instances, unused flag and primitive combinations are released
+    _mixin_types: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
 
     def __init__(self, *value, static_context: Optional[str] = '', dynamic_context: Optional[str] = None, **kwargs) -> None:
         '''
@@ -335,10 +338,19 @@ class Symbol(metaclass=SymbolMeta):
         primitives          = primitives if not standard_primitives else cls._primitives
         if not isinstance(primitives, list):
             primitives = [primitives]
+        # configure standard primitives on the mixin type instead of on each instance
+        flags = {}
+        if use_mixin and standard_primitives:
+            # disable shortcut matches for all primitives
+            if only_nesy:
+                flags['__disable_shortcut_matches__'] = True
+            # allow to iterate over iterables for neuro-symbolic values
+            if iterate_nesy:
+                flags['__nesy_iteration_primitives__'] = True
         # Initialize instance as a combination of Symbol and the mixin primitive types
         if use_mixin:
             # create a new cls type that inherits from Symbol and the mixin primitive types
-            cls       = SymbolMeta(cls.__name__, (cls,) + tuple(primitives), {})
+            cls = Symbol._mixin_type((cls,) + tuple(primitives), flags)
         obj = super().__new__(cls)
         # store to inherit when creating new instances
         obj._kwargs = {
@@ -349,14 +361,6 @@ class Symbol(metaclass=SymbolMeta):
             'iterate_nesy': iterate_nesy,
             **kwargs
         }
-        # configure standard primitives
-        if use_mixin and standard_primitives:
-            # disable shortcut matches for all primitives
-            if only_nesy:
-                obj.__disable_shortcut_matches__ = True
-            # allow to iterate over iterables for neuro-symbolic values
-            if iterate_nesy:
-                obj.__nesy_iteration_primitives__ = True
         # If metatype has additional runtime primitives, add them to the instance
         if Symbol._metadata._primitives is not None:
             for prim_name in list(Symbol._metadata._primitives.keys()):
@@ -459,6 +463,26 @@ class Symbol(metaclass=SymbolMeta):
     def __reduce_ex__(self, protocol):
         return self.__reduce__()
 
+    @staticmethod
+    def _mixin_type(bases: Tuple[Type, ...], flags: Dict[str, bool]) -> Type:
+        '''
+        Get the mixin type for the given bases and flags.
+        The type is only created once per bases and flags combination and reused while instances of it exist.
+
+        Args:
+            bases (Tuple[Type, ...]): The symbol class followed by the mixin primitive types.
+            flags (Dict[str, bool]): The class attributes which configure the standard primitives.
+
+        Returns:
+            Type: The mixin type.
+        '''
+        key       = (bases, *flags)
+        mixin_cls = Symbol._mixin_types.get(key)
+        if mixin_cls is None:
+            mixin_cls = SymbolMeta(bases[0].__name__, bases, flags)
+            Symbol._mixin_types[key] = mixin_cls
+        return mixin_cls
+
     # This will be called by pickle with the info from __reduce__ to recreate the dynamic class
     @staticmethod
     def _reconstruct_class(base_cls, use_mixin, primitives_info):
@@ -476,8 +500,8 @@ class Symbol(metaclass=SymbolMeta):
         if use_mixin:
             # Convert primitive info tuples back to types
             primitives     = [primitive for primitive, name in primitives_info]
-            # Create new cls with UnifiedMeta metaclass
-            cls            = SymbolMeta(base_cls.__name__, (base_cls,) + tuple(primitives), {})
+            # Reuse the cached mixin type, the flags are restored on the instance by __setstate__
+            cls            = Symbol._mixin_type((base_cls,) + tuple(primitives), {})
             obj            = cls()
             return obj
         return base_cls()
@@ -503,6 +527,11 @@ class Symbol(metaclass=SymbolMeta):
             state (dict): The state to set the symbol to.
         '''
         vars(self).update(state)
+        # the flags of the standard primitives live on the mixin type, which is not restored by pickle
+        if self._kwargs.get('only_nesy'):
+            self.__disable_shortcut_matches__  = True
+        if self._kwargs.get('iterate_nesy'):
+            self.__nesy_iteration_primitives__ = True
         self._metadata   = Metadata()
         self._metadata.symbol_type = type(self)
         self._kwargs     = self._kwargs
@@ -542,20 +571,11 @@ class Symbol(metaclass=SymbolMeta):
         '''
         if isinstance(value, Symbol):
             return value
-        # inherit kwargs for new symbol instance
-        kwargs = {**self._kwargs, **kwargs}
-        sym    = Symbol(value, **kwargs)
-        return sym
-
-    @property
-    def _symbol_type(self) -> "Symbol":
-        '''
-        Get the type of the Symbol instance.
-
-        Returns:
-            Symbol: The type of the Symbol instance.
-        '''
-        return Symbol
+        # inherit kwargs for new symbol instance and only merge them if overrides are given
+        if kwargs:
+            kwargs = {**self._kwargs, **kwargs}
+            return Symbol(value, **kwargs)
+        return Symbol(value, **self._kwargs)
 
     def __hash__(self) -> int:
         '''
@@ -931,6 +951,11 @@ class Symbol(metaclass=SymbolMeta):
         Symbol._metadata._primitives[name] = _func
 
 
+# the type of the Symbol instance used by the primitives for type checks and casting
+# stored as plain class attribute to avoid resolving a property on every operator call
+Symbol._symbol_type = Symbol
+
+
 # TODO: Workaround for Python bug to enable runtime assignment of lambda function to new Symbol objects.
 # Currently creating multiple lambda functions within class __new__ definition only links last lambda function to all new Symbol attribute assignments.
 # Need to contact Python developers to fix this bug.
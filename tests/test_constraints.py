@@ -0,0 +1,66 @@
+import unittest
+
+from symai import Symbol
+from symai.constraints import DictFormatConstraint
+from symai.exceptions import ConstraintViolationException
+
+
+class TestDictFormatConstraint(unittest.TestCase):
+    def setUp(self):
+        self.constraint = DictFormatConstraint({'name': '', 'age': 0})
+
+    def test_str_input(self):
+        self.assertTrue(self.constraint('{"name": "Alice", "age": 30}'))
+        with self.assertRaises(ConstraintViolationException):
+            self.constraint('{"name": "Alice", "age": 30')
+        with self.assertRaises(ConstraintViolationException):
+            self.constraint('{"name": "Alice"}')
+
+    def test_symbol_input(self):
+        self.assertTrue(self.constraint(Symbol('{"name": "Alice", "age": 30}')))
+        self.assertTrue(self.constraint(Symbol({'name': 'Alice', 'age': 30})))
+        with self.assertRaises(ConstraintViolationException):
+            self.constraint(Symbol('{"name": "Alice", "age": "30"}'))
+
+    def test_dict_input(self):
+        self.assertTrue(self.constraint({'name': 'Alice', 'age': 30}))
+        with self.assertRaises(ConstraintViolationException):
+            self.constraint({'name': 'Alice', 'age': '30'})
+
+    def test_unsupported_input(self):
+        for value in [1, ['name', 'age'], Symbol(1)]:
+            with self.subTest(value=value):
+                with self.assertRaises(ConstraintViolationException):
+                    self.constraint(value)
+
+    def test_str_format(self):
+        constraint = DictFormatConstraint('{"name": "", "age": 0}')
+        self.assertTrue(constraint({'name': 'Alice', 'age': 30}))
+
+
+class TestCheckKeys(unittest.TestCase):
+    def test_flat(self):
+        self.assertTrue(DictFormatConstraint.check_keys({'a': 0, 'b': ''}, {'a': 1, 'b': 'x', 'c': None}))
+        with self.assertRaises(ConstraintViolationException):
+            DictFormatConstraint.check_keys({'a': 0, 'b': ''}, {'a': 1})
+
+    def test_nested(self):
+        json_format = {'a': {'b': {'c': 0, 'd': ''}}}
+        self.assertTrue(DictFormatConstraint.check_keys(json_format, {'a': {'b': {'c': 1, 'd': 'x'}}}))
+        for gen_dict in [{'a': {'b': {'c': 1}}}, {'a': {'b': {'c': '1', 'd': 'x'}}}, {'a': {'b': 1}}, {'a': 1}, {}]:
+            with self.subTest(gen_dict=gen_dict):
+                with self.assertRaises(ConstraintViolationException):
+                    DictFormatConstraint.check_keys(json_format, gen_dict)
+
+    def test_nested_dict_values(self):
+        # the keys before a nested dictionary are checked at its level
+        with self.assertRaises(ConstraintViolationException):
+            DictFormatConstraint.check_keys({'a': 0, 'b': {'c': 0}}, {'b': {'c': 1}})
+        # descending into the first nested dictionary returns its result, later keys of the outer level are not checked
+        self.assertTrue(DictFormatConstraint.check_keys({'a': {'b': 0}, 'c': 0}, {'a': {'b': 1}}))
+        with self.assertRaises(ConstraintViolationException):
+            DictFormatConstraint.check_keys({'a': {'b': 0}, 'c': 0}, {'a': {}, 'c': 1})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+
+from symai.functional import ProbabilisticBooleanMode, _probabilistic_bool, _signature
+
+
+class TestProbabilisticBool(unittest.TestCase):
+    def test_exact_tokens(self):
+        for rsp in ['true', 'yes', 'ok', "['true']", "'true'", "'yes'"]:
+            self.assertTrue(_probabilistic_bool(rsp, mode=ProbabilisticBooleanMode.MEDIUM), rsp)
+        for rsp in ['true', '1', 't', 'y', 'yeah', 'yup', 'certainly', "'certainly'", "['true']"]:
+            self.assertTrue(_probabilistic_bool(rsp, mode=ProbabilisticBooleanMode.TOLERANT), rsp)
+        # tolerant only tokens are not accepted in medium mode
+        for rsp in ['1', 't', 'yeah', 'certainly']:
+            self.assertFalse(_probabilistic_bool(rsp, mode=ProbabilisticBooleanMode.MEDIUM), rsp)
+        self.assertTrue(_probabilistic_bool('true', mode=ProbabilisticBooleanMode.STRICT))
+        self.assertFalse(_probabilistic_bool('yes', mode=ProbabilisticBooleanMode.STRICT))
+
+    def test_casing(self):
+        for mode in ProbabilisticBooleanMode:
+            self.assertTrue(_probabilistic_bool('TRUE', mode=mode), mode)
+            self.assertTrue(_probabilistic_bool('True', mode=mode), mode)
+        self.assertTrue(_probabilistic_bool('Yes', mode=ProbabilisticBooleanMode.MEDIUM))
+        self.assertTrue(_probabilistic_bool('CERTAINLY', mode=ProbabilisticBooleanMode.TOLERANT))
+
+    def test_whitespace(self):
+        # responses are matched as they are, surrounding whitespace is not stripped
+        for mode in ProbabilisticBooleanMode:
+            self.assertFalse(_probabilistic_bool(' true', mode=mode), mode)
+            self.assertFalse(_probabilistic_bool('true\n', mode=mode), mode)
+
+    def test_fragments_and_false(self):
+        for mode in ProbabilisticBooleanMode:
+            for rsp in ['', 'e', 'rue', "', '", 'false', 'no', None]:
+                self.assertFalse(_probabilistic_bool(rsp, mode=mode), (rsp, mode))
+
+    def test_invalid_mode(self):
+        with self.assertRaises(ValueError):
+            _probabilistic_bool('true', mode='invalid')
+
+
+class SlottedCallable:
+    __slots__ = ()
+
+    def __call__(self, instance, value: str) -> bool:
+        pass
+
+
+class TestSignature(unittest.TestCase):
+    def test_cached(self):
+        def func(instance, value: str) -> bool:
+            pass
+        self.assertIs(_signature(func), _signature(func))
+        self.assertEqual(list(_signature(func).parameters), ['instance', 'value'])
+
+    def test_not_weakly_referenceable(self):
+        # these callables cannot be cached and fall back to an uncached signature
+        self.assertEqual(list(_signature(SlottedCallable()).parameters), ['instance', 'value'])
+        self.assertEqual(list(_signature([].append).parameters), ['object'])
+
+
+if __name__ == '__main__':
+    unittest.main()
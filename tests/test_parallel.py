@@ -0,0 +1,140 @@
+import asyncio
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from symai import Expression, core_ext
+from symai.backend.engines.neurosymbolic.engine_openai_gptX_chat import GPTXChatEngine
+from symai.components import Parallel
+
+
+class AddExpression(Expression):
+    def __init__(self, n: int, delay: float = 0.0, **kwargs):
+        super().__init__(**kwargs)
+        self.n     = n
+        self.delay = delay
+
+    def forward(self, x, **kwargs):
+        # earlier expressions finish later to detect results collected in completion order
+        time.sleep(self.delay)
+        return x + self.n
+
+
+class FailExpression(Expression):
+    def forward(self, x, **kwargs):
+        raise ValueError(f'Failed on {x}')
+
+
+class TestParallel(unittest.TestCase):
+    def _expressions(self):
+        return [AddExpression(n, delay=0.05 * (3 - n)) for n in range(4)]
+
+    def test_threads_result_order(self):
+        res = Parallel(*self._expressions(), threads=True)(10)
+        self.assertEqual(res.value, [10, 11, 12, 13])
+
+    def test_threads_match_processes(self):
+        threads   = Parallel(*self._expressions(), threads=True)(10)
+        processes = Parallel(*self._expressions())(10)
+        self.assertEqual(threads.value, processes.value)
+
+    def test_threads_exception(self):
+        expr = [AddExpression(1), FailExpression(), AddExpression(2)]
+        with self.assertRaises(ValueError) as threads:
+            Parallel(*expr, threads=True)(10)
+        with self.assertRaises(ValueError) as processes:
+            Parallel(*expr)(10)
+        self.assertEqual(str(threads.exception), str(processes.exception))
+
+
+class LoopBoundClient:
+    # stands in for openai.AsyncClient whose connection pool may only be used by one event loop at a time
+    lock    = threading.Lock()
+    clients = []
+    errors  = []
+
+    def __init__(self, api_key=None):
+        self.loops = set()
+        self.chat  = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+        with self.lock:
+            self.clients.append(self)
+
+    async def create(self, messages, **kwargs):
+        loop = asyncio.get_running_loop()
+        with self.lock:
+            # recorded instead of raised, the engine would otherwise retry the request with its remedy strategy
+            if len(self.loops) > 0:
+                self.errors.append(RuntimeError('Client is used by several event loops at once.'))
+            self.loops.add(loop)
+        try:
+            await asyncio.sleep(0.05)
+        finally:
+            with self.lock:
+                self.loops.discard(loop)
+        message = SimpleNamespace(content=messages[0]['content'].upper())
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+class EngineExpression(Expression):
+    def __init__(self, engine: GPTXChatEngine, text: str, **kwargs):
+        super().__init__(**kwargs)
+        self.engine = engine
+        self.text   = text
+
+    def forward(self, *args, **kwargs):
+        argument = SimpleNamespace(
+            kwargs={'max_tokens': 10},
+            prop=SimpleNamespace(prepared_input=[{'role': 'user', 'content': self.text}])
+        )
+        output, _ = self.engine.forward(argument)
+        return output[0]
+
+
+class TestParallelEngine(unittest.TestCase):
+    def setUp(self):
+        module  = 'symai.backend.engines.neurosymbolic.engine_openai_gptX_chat'
+        patches = [
+            mock.patch(f'{module}.openai.AsyncClient', LoopBoundClient),
+            mock.patch(f'{module}.tiktoken.encoding_for_model'),
+            mock.patch.object(GPTXChatEngine, 'id', return_value='neurosymbolic'),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        LoopBoundClient.clients.clear()
+        LoopBoundClient.errors.clear()
+        self.engine = GPTXChatEngine(api_key='key', model='gpt-4-0613')
+
+    def test_threads_engine_calls(self):
+        expr = [EngineExpression(self.engine, text) for text in ['a', 'b', 'c', 'd']]
+        res  = Parallel(*expr, threads=True)()
+        self.assertEqual(res.value, ['A', 'B', 'C', 'D'])
+        self.assertEqual(LoopBoundClient.errors, [])
+
+    def test_concurrent_event_loops(self):
+        expr = [EngineExpression(self.engine, text) for text in ['a', 'b', 'c', 'd']]
+
+        # one worker per expression to run all event loops at once, independent of the cpu count
+        @core_ext.parallel(expr, worker=len(expr), threads=True)
+        def _func(e):
+            return e()
+
+        self.assertEqual(_func(), ['A', 'B', 'C', 'D'])
+        # concurrent event loops never share a client, threads reuse theirs for later calls
+        self.assertEqual(LoopBoundClient.errors, [])
+        self.assertLessEqual(len(LoopBoundClient.clients), len(expr))
+
+    def test_client_per_thread(self):
+        client  = self.engine.client
+        clients = []
+        thread  = threading.Thread(target=lambda: clients.append(self.engine.client))
+        thread.start()
+        thread.join()
+        self.assertIs(self.engine.client, client)
+        self.assertIsNot(clients[0], client)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,30 @@
+import json
+import unittest
+
+from symai.post_processors import JsonTruncatePostProcessor, _truncate_json
+
+
+class TestJsonTruncatePostProcessor(unittest.TestCase):
+    def test_valid_json_unchanged(self):
+        res = 'Here you go: {"a": [1, 2], "b": "x"} done.'
+        self.assertEqual(_truncate_json(res), '{"a": [1, 2], "b": "x"}')
+
+    def test_trailing_commas(self):
+        res = _truncate_json('{"a": [1, 2, ], "b": {"c": 3,\n},}')
+        self.assertEqual(json.loads(res), {'a': [1, 2], 'b': {'c': 3}})
+
+    def test_commas_inside_strings(self):
+        res = _truncate_json('{"a": "keep ,} and ,] here", "b": "escaped \\", }", "c": [1,],}')
+        self.assertEqual(json.loads(res), {'a': 'keep ,} and ,] here', 'b': 'escaped ", }', 'c': [1]})
+
+    def test_unparseable_unchanged(self):
+        res = '{"a": [1, 2,], "b": }'
+        self.assertEqual(_truncate_json(res), res)
+
+    def test_post_processor(self):
+        res = JsonTruncatePostProcessor()('```json\n{"a": 1,}\n```', None)
+        self.assertEqual(json.loads(res), {'a': 1})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,438 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from symai import Symbol, core
+from symai.ops.primitives import EmbeddingPrimitives, ExecutionControlPrimitives, PatternMatchingPrimitives
+
+
+def _engine_equals(**kwargs):
+    # replaces the neuro-symbolic decorator, the decorated function reports the engine call
+    def decorator(func):
+        def wrapper(instance, string):
+            return 'engine'
+        return wrapper
+    return decorator
+
+
+class TestEqualsShortcut(unittest.TestCase):
+    def test_exactly_shortcut(self):
+        with mock.patch.object(core, 'equals', side_effect=_engine_equals) as equals:
+            self.assertTrue(Symbol('cat').equals('cat', context='exactly').value)
+            self.assertFalse(Symbol('cat').equals('dog', context='exactly').value)
+            self.assertTrue(Symbol('cat').equals(Symbol('cat'), context='exactly').value)
+            self.assertTrue(Symbol(1).equals(1, context='exactly').value)
+            equals.assert_not_called()
+
+    def test_disabled_shortcut(self):
+        with mock.patch.object(core, 'equals', side_effect=_engine_equals) as equals:
+            res = Symbol('cat', only_nesy=True).equals('cat', context='exactly')
+            self.assertEqual(res.value, 'engine')
+            equals.assert_called_once_with(context='exactly')
+
+    def test_kwargs_use_engine(self):
+        with mock.patch.object(core, 'equals', side_effect=_engine_equals) as equals:
+            res = Symbol('cat').equals('cat', context='exactly', max_tokens=10)
+            self.assertEqual(res.value, 'engine')
+            equals.assert_called_once_with(context='exactly', max_tokens=10)
+
+    def test_other_context_use_engine(self):
+        with mock.patch.object(core, 'equals', side_effect=_engine_equals) as equals:
+            res = Symbol('cat').equals('cat')
+            self.assertEqual(res.value, 'engine')
+            equals.assert_called_once_with(context='contextually')
+
+
+class StrSubclass(str):
+    pass
+
+
+class TestStringOperands(unittest.TestCase):
+    def test_str_subclasses_concatenate(self):
+        # string subclasses take the same concatenation branch as plain strings
+        for cls in [StrSubclass, np.str_]:
+            with self.subTest(cls=cls):
+                self.assertEqual((Symbol(cls('a')) | 'b').value, (Symbol('a') | 'b').value)
+                self.assertEqual((Symbol('a') | cls('b')).value, (Symbol('a') | 'b').value)
+                self.assertEqual((Symbol('a') | Symbol(cls('b'))).value, (Symbol('a') | 'b').value)
+                self.assertEqual((Symbol(cls('a')) & 'b').value, (Symbol('a') & 'b').value)
+                self.assertEqual((Symbol('a') & cls('b')).value, (Symbol('a') & 'b').value)
+                self.assertEqual((Symbol('a') & Symbol(cls('b'))).value, (Symbol('a') & 'b').value)
+
+
+class TestItemAccess(unittest.TestCase):
+    def setUp(self):
+        # the neuro-symbolic fallback reports that it was called instead of querying the engine
+        nesy_op = mock.patch('symai.ops.primitives._nesy_op', return_value=lambda sym, *args: 'engine')
+        self.nesy_op = nesy_op.start()
+        self.addCleanup(nesy_op.stop)
+
+    def test_getitem_dict(self):
+        sym = Symbol({'a': 1, 2: 'b'})
+        self.assertEqual(sym['a'], 1)
+        self.assertEqual(sym[2], 'b')
+        with self.assertRaises(KeyError):
+            sym['c']
+        with self.assertRaises(KeyError):
+            Symbol({'a': 1}, iterate_nesy=True)['c']
+        self.nesy_op.assert_not_called()
+
+    def test_getitem_sequences(self):
+        for value in [[1, 2, 3], (1, 2, 3), np.array([1, 2, 3])]:
+            with self.subTest(value=value):
+                sym = Symbol(value)
+                self.assertEqual(sym[0], 1)
+                self.assertEqual(sym[-1], 3)
+                self.assertEqual(list(sym[1:]), [2, 3])
+                self.assertEqual(sym[True], 2)
+                with self.assertRaises(IndexError):
+                    sym[3]
+        self.nesy_op.assert_not_called()
+
+    def test_getitem_nesy_fallback(self):
+        with self.assertRaises(KeyError):
+            Symbol([1, 2, 3])['a']
+        with self.assertRaises(KeyError):
+            Symbol('one two three')['second word']
+        self.nesy_op.assert_not_called()
+        self.assertEqual(Symbol('one two three', iterate_nesy=True)['second word'].value, 'engine')
+        self.assertEqual(Symbol('one two three', iterate_nesy=True)[1].value, 'engine')
+        self.nesy_op.assert_called_with('getitem')
+
+    def test_setitem(self):
+        sym    = Symbol({'a': 1})
+        sym['b'] = 2
+        self.assertEqual(sym.value, {'a': 1, 'b': 2})
+        sym    = Symbol([1, 2, 3])
+        sym[0] = 4
+        sym[1:] = [5]
+        self.assertEqual(sym.value, [4, 5])
+        self.nesy_op.assert_not_called()
+        sym = Symbol('one two three', iterate_nesy=True)
+        sym['second word'] = 'four'
+        self.assertEqual(sym.value, 'engine')
+        self.nesy_op.assert_called_with('setitem')
+
+    def test_delitem(self):
+        sym = Symbol({'a': 1, 2: 'b'})
+        del sym['a']
+        del sym[2]
+        self.assertEqual(sym.value, {})
+        with self.assertRaises(KeyError):
+            del sym['a']
+        with self.assertRaises(KeyError):
+            del Symbol([1, 2, 3])[0]
+        self.nesy_op.assert_not_called()
+        sym = Symbol('one two three', iterate_nesy=True)
+        del sym['second word']
+        self.assertEqual(sym.value, 'engine')
+        self.nesy_op.assert_called_with('delitem')
+
+
+class FailingExpression:
+    def __init__(self, exception: Exception, failures: int):
+        self.exception = exception
+        self.failures  = failures
+        self.calls     = 0
+
+    def __call__(self, sym, **kwargs):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise self.exception
+        return sym
+
+
+class TestFtryRetries(unittest.TestCase):
+    def setUp(self):
+        # the error analysis and correction call the engine, therefore both are replaced
+        analyze = mock.patch.object(ExecutionControlPrimitives, 'analyze', return_value='analysis')
+        correct = mock.patch.object(PatternMatchingPrimitives, 'correct', side_effect=lambda *args, **kwargs: Symbol('corrected'))
+        self.analyze = analyze.start()
+        self.correct = correct.start()
+        self.addCleanup(analyze.stop)
+        self.addCleanup(correct.stop)
+
+    def test_retries_exhausted(self):
+        expr = FailingExpression(ValueError('fail'), failures=10)
+        with self.assertRaises(ValueError):
+            Symbol('x').ftry(expr, retries=2)
+        self.assertEqual(expr.calls, 3)
+        self.assertEqual(self.analyze.call_count, 2)
+        self.assertEqual(self.correct.call_count, 2)
+
+    def test_retry_succeeds(self):
+        expr = FailingExpression(ValueError('fail'), failures=1)
+        res  = Symbol('x').ftry(expr, retries=2)
+        self.assertEqual(expr.calls, 2)
+        self.assertEqual(res.value, 'corrected')
+
+    def test_memory_error_not_retried(self):
+        expr = FailingExpression(MemoryError(), failures=10)
+        with self.assertRaises(MemoryError):
+            Symbol('x').ftry(expr, retries=2)
+        self.assertEqual(expr.calls, 1)
+        self.analyze.assert_not_called()
+        self.correct.assert_not_called()
+
+
+_OPERATORS = ['__truediv__', '__rtruediv__', '__itruediv__', '__floordiv__', '__rfloordiv__', '__ifloordiv__',
+              '__pow__', '__rpow__', '__ipow__', '__mod__', '__rmod__', '__imod__', '__mul__', '__rmul__', '__imul__']
+
+
+class TestArithmeticFastPath(unittest.TestCase):
+    values = [7, 7.5, np.int64(7), np.float64(7.5), np.array([7, 8])]
+    others = [2, 2.5, np.int64(2), np.float64(2.5), np.array([2, 3]), Symbol(2), Symbol(np.array([2, 3]))]
+
+    def _apply(self, name, value, other, generic: bool = False):
+        # without numeric types every operand is cast to a symbol and computed by the type specific dispatch
+        numeric_types = frozenset() if generic else frozenset({int, float, np.int64, np.float64, np.ndarray})
+        with mock.patch('symai.ops.primitives._NUMERIC_TYPES', numeric_types):
+            sym = Symbol(value)
+            res = getattr(sym, name)(other)
+        if name.startswith('__i'):
+            self.assertIs(res, sym)
+        return res.value
+
+    def assertSameValue(self, fast, generic):
+        self.assertIs(type(fast), type(generic))
+        if isinstance(fast, np.ndarray):
+            self.assertEqual(fast.dtype, generic.dtype)
+            np.testing.assert_array_equal(fast, generic)
+        else:
+            self.assertEqual(fast, generic)
+
+    def test_matches_generic_path(self):
+        for name in _OPERATORS:
+            for value in self.values:
+                for other in self.others:
+                    with self.subTest(op=name, value=value, other=other):
+                        fast    = self._apply(name, value, other)
+                        generic = self._apply(name, value, other, generic=True)
+                        self.assertSameValue(fast, generic)
+
+    def test_native_results(self):
+        self.assertEqual((Symbol(7) / 2).value, 3.5)
+        self.assertEqual((Symbol(7) // 2).value, 3)
+        self.assertEqual((2 ** Symbol(3)).value, 8)
+        self.assertEqual((7 % Symbol(4)).value, 3)
+        sym  = Symbol(np.array([1, 2]))
+        sym *= 3
+        np.testing.assert_array_equal(sym.value, np.array([3, 6]))
+
+    def test_failures_match_generic_path(self):
+        # zero divisors fall back to the type specific dispatch and its string split or error
+        for name in ['__truediv__', '__floordiv__']:
+            with self.subTest(op=name):
+                self.assertEqual(self._apply(name, 7, 0), self._apply(name, 7, 0, generic=True))
+        for generic in [False, True]:
+            with self.subTest(generic=generic):
+                with self.assertRaises(NotImplementedError):
+                    self._apply('__mod__', 7, 0, generic=generic)
+
+
+def _length_embed(sym, **kwargs):
+    # embeds every entry by its length to tell the embedded entries apart
+    value = sym.value if isinstance(sym.value, list) else [sym.value]
+    return Symbol(np.array([[float(len(v))] for v in value]))
+
+
+class TestZipEmbedding(unittest.TestCase):
+    def setUp(self):
+        embed = mock.patch.object(EmbeddingPrimitives, 'embed', autospec=True, side_effect=_length_embed)
+        self.embed = embed.start()
+        self.addCleanup(embed.stop)
+
+    def _embeds(self, sym):
+        return [embeds for _, embeds, _ in sym.zip()]
+
+    def test_reuse_embedding(self):
+        sym = Symbol(['a', 'bb'])
+        sym.embedding
+        self.assertEqual(self._embeds(sym), [[1.0], [2.0]])
+        self.assertEqual(self.embed.call_count, 1)
+
+    def test_changed_entry(self):
+        sym = Symbol(['a', 'bb'])
+        sym.embedding
+        sym[0] = 'ccc'
+        self.assertEqual(self._embeds(sym), [[3.0], [2.0]])
+        self.assertEqual(self.embed.call_count, 2)
+
+    def test_appended_entry(self):
+        sym = Symbol(['a', 'bb'])
+        sym.embedding
+        sym.value.append('dddd')
+        self.assertEqual(self._embeds(sym), [[1.0], [2.0], [4.0]])
+        self.assertEqual(self.embed.call_count, 2)
+
+    def test_kwargs_embed_again(self):
+        sym = Symbol(['a', 'bb'])
+        sym.embedding
+        sym.zip(max_tokens=10)
+        self.assertEqual(self.embed.call_count, 2)
+
+
+# kernels as computed before the reductions were fused, with the default kernel arguments
+_EPS = 1e-8
+_REFERENCE_KERNELS = {
+    'gaussian':             lambda v, o: np.exp(-1 * np.sum((v - o)**2, axis=0)),
+    'rbf':                  lambda v, o: np.exp(-1 * np.sum((v - o)**2, axis=0)),
+    'laplacian':            lambda v, o: np.exp(-1 * np.sum(np.abs(v - o), axis=0)),
+    'polynomial':           lambda v, o: (1 * np.sum((v * o), axis=0) + 1)**3,
+    'sigmoid':              lambda v, o: np.tanh(1 * np.sum((v * o), axis=0) + 1),
+    'linear':               lambda v, o: np.sum((v * o), axis=0),
+    'cauchy':               lambda v, o: 1 / (1 + np.sum((v - o)**2, axis=0) / 1),
+    't-distribution':       lambda v, o: 1 / (1 + (np.sum((v - o)**2, axis=0) / (1 * 1))**(1 + 1) / 2),
+    'inverse-multiquadric': lambda v, o: 1 / np.sqrt(np.sum((v - o)**2, axis=0) / 1**2 + 1),
+    'cosine':               lambda v, o: 1 - (np.sum(v * o, axis=0) / (np.sqrt(np.sum(v**2, axis=0)) * np.sqrt(np.sum(o**2, axis=0)) + _EPS)),
+    'angular-cosine':       lambda v, o: 1 * np.arccos(np.sum(v * o, axis=0) / (np.sqrt(np.sum(v**2, axis=0)) * np.sqrt(np.sum(o**2, axis=0)) + _EPS)) / np.pi,
+}
+
+
+def _reference_value(val):
+    # a single value is returned as python scalar
+    return val if val.ndim >= 1 and val.shape[0] > 1 else val.item()
+
+
+class TestDistanceKernels(unittest.TestCase):
+    def _embeddings(self, dtype):
+        rng = np.random.default_rng(0)
+        if np.issubdtype(dtype, np.integer):
+            # large enough that int32 products overflow unless they are accumulated like np.sum does
+            return [rng.integers(-50_000, 50_000, size=16).astype(dtype) for _ in range(4)]
+        return [rng.standard_normal(16).astype(dtype) for _ in range(4)]
+
+    def assertKernelEqual(self, res, ref, dtype):
+        if dtype == np.float64:
+            np.testing.assert_allclose(res, ref, rtol=1e-12)
+        else:
+            np.testing.assert_array_equal(res, ref)
+
+    def test_matches_reference(self):
+        for dtype in [np.float64, np.float32, np.int32, np.int64]:
+            v, *others = self._embeddings(dtype)
+            for kernel, reference in _REFERENCE_KERNELS.items():
+                with self.subTest(kernel=kernel, dtype=dtype):
+                    # single candidate
+                    res = Symbol(v).distance(others[0], kernel=kernel)
+                    ref = _reference_value(reference(v[:, None], others[0][:, None]))
+                    self.assertKernelEqual(res, ref, dtype)
+                    # list of candidates
+                    res = Symbol(v).distance(others, kernel=kernel)
+                    ref = _reference_value(reference(v[:, None], np.stack(others, axis=1)))
+                    self.assertKernelEqual(res, ref, dtype)
+
+
+def _reference_rbf(v, o, bandwidth):
+    # the bandwidths as accumulated one by one before they were broadcast
+    d   = np.sum((v - o)**2, axis=0)
+    val = 0
+    for a in bandwidth:
+        gamma = 1.0 / (2 * a)
+        val  += np.exp(-gamma * d)
+    return val
+
+
+class TestRbfBandwidth(unittest.TestCase):
+    def setUp(self):
+        rng         = np.random.default_rng(1)
+        self.v      = rng.standard_normal(8)
+        self.others = [rng.standard_normal(8) for _ in range(3)]
+
+    def test_scalar_bandwidth(self):
+        res = Symbol(self.v).distance(self.others[0], kernel='rbf', bandwidth=2.0)
+        ref = _reference_rbf(self.v[:, None], self.others[0][:, None], [2.0])
+        self.assertIsInstance(res, float)
+        self.assertAlmostEqual(res, ref.item(), places=12)
+
+    def test_bandwidth_list(self):
+        res = Symbol(self.v).distance(self.others[0], kernel='rbf', bandwidth=[0.5, 1.0, 2.0])
+        ref = _reference_rbf(self.v[:, None], self.others[0][:, None], [0.5, 1.0, 2.0])
+        self.assertIsInstance(res, float)
+        self.assertAlmostEqual(res, ref.item(), places=12)
+
+    def test_multiple_candidates(self):
+        o = np.stack(self.others, axis=1)
+        for bandwidth in [2.0, [2.0], [0.5, 1.0, 2.0]]:
+            with self.subTest(bandwidth=bandwidth):
+                res = Symbol(self.v).distance(self.others, kernel='rbf', bandwidth=bandwidth)
+                ref = _reference_rbf(self.v[:, None], o, np.atleast_1d(bandwidth))
+                self.assertEqual(res.shape, (len(self.others),))
+                np.testing.assert_allclose(res, ref, rtol=1e-12)
+
+    def test_float32_candidates(self):
+        v      = self.v.astype(np.float32)
+        others = [x.astype(np.float32) for x in self.others]
+        res    = Symbol(v).distance(others, kernel='rbf', bandwidth=[0.5, 2.0])
+        ref    = _reference_rbf(v[:, None], np.stack(others, axis=1), [0.5, 2.0])
+        self.assertEqual(res.dtype, np.float32)
+        np.testing.assert_allclose(res, ref, rtol=1e-6)
+
+
+class TestNormalizedCosine(unittest.TestCase):
+    def setUp(self):
+        rng         = np.random.default_rng(2)
+        unit        = lambda x: x / np.linalg.norm(x)
+        self.v      = unit(rng.standard_normal(8))
+        self.others = [unit(rng.standard_normal(8)) for _ in range(3)]
+
+    def test_unit_norm_embeddings(self):
+        for kernel in ['cosine', 'angular-cosine']:
+            for other in [self.others[0], self.others]:
+                with self.subTest(kernel=kernel, candidates=isinstance(other, list)):
+                    res = Symbol(self.v).distance(other, kernel=kernel, normalized=True)
+                    ref = Symbol(self.v).distance(other, kernel=kernel)
+                    np.testing.assert_allclose(res, ref, rtol=1e-6)
+
+    def test_skips_norms(self):
+        # the inner product is used as is, therefore the embeddings must already have unit norm
+        v, o = np.array([2.0, 0.0]), np.array([1.0, 1.0])
+        self.assertAlmostEqual(Symbol(v).distance(o, kernel='cosine', normalized=True), 1 - 2.0)
+        self.assertAlmostEqual(Symbol(v).distance(o, kernel='cosine'), 1 - 2.0 / (2.0 * np.sqrt(2.0) + 1e-8))
+
+    def test_integer_embeddings(self):
+        v, others = np.array([1, 0, 0]), [np.array([0, 1, 0]), np.array([1, 0, 0])]
+        np.testing.assert_allclose(Symbol(v).distance(others, kernel='angular-cosine', normalized=True), [0.5, 0.0])
+        np.testing.assert_allclose(Symbol(v).distance(others, kernel='cosine', normalized=True), [1.0, 0.0])
+
+
+def _reference_similarity(v, o, metric):
+    # the full o.T@o gram matrix normalization before the per column norms, reduced to its diagonal
+    cos = v.T@o / (np.sqrt(v.T@v) * np.sqrt(o.T@o) + 1e-8)
+    if metric == 'angular-cosine':
+        cos = 1 - (1 * np.arccos(cos) / np.pi)
+    return cos.diagonal() if cos.shape[0] > 1 else cos[0]
+
+
+class TestCosineSimilarity(unittest.TestCase):
+    def setUp(self):
+        rng         = np.random.default_rng(3)
+        self.v      = rng.standard_normal(8)
+        self.others = [rng.standard_normal(8) for _ in range(4)]
+
+    def test_list_candidates(self):
+        o = np.stack(self.others, axis=1)
+        for metric in ['cosine', 'angular-cosine']:
+            with self.subTest(metric=metric):
+                res = Symbol(self.v).similarity(self.others, metric=metric)
+                ref = _reference_similarity(self.v[:, None], o, metric)
+                self.assertEqual(res.shape, (len(self.others),))
+                np.testing.assert_allclose(res, ref, rtol=1e-12)
+
+    def test_single_candidate(self):
+        for metric in ['cosine', 'angular-cosine']:
+            with self.subTest(metric=metric):
+                res = Symbol(self.v).similarity(self.others[0], metric=metric)
+                ref = _reference_similarity(self.v[:, None], self.others[0][:, None], metric)
+                np.testing.assert_allclose(res, ref, rtol=1e-12)
+
+    def test_parallel_vectors(self):
+        # rounding may push the cosine of parallel vectors above one, the arccos must not return nan
+        res = Symbol(self.v).similarity([self.v * 3, -self.v], metric='angular-cosine')
+        self.assertFalse(np.isnan(res).any())
+        np.testing.assert_allclose(res, [1.0, 0.0], atol=1e-4)
+
+
+if __name__ == '__main__':
+    unittest.main()
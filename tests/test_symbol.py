@@ -0,0 +1,58 @@
+import gc
+import os
+import tempfile
+import unittest
+import weakref
+
+from symai import Symbol
+
+
+class TestMixinTypes(unittest.TestCase):
+    def test_type_reuse(self):
+        self.assertIs(type(Symbol('a')), type(Symbol('b')))
+        self.assertIs(type(Symbol('a', only_nesy=True)), type(Symbol('b', only_nesy=True)))
+        self.assertIs(type(Symbol('a', iterate_nesy=True)), type(Symbol('b', iterate_nesy=True)))
+        self.assertIsNot(type(Symbol('a')), type(Symbol('a', only_nesy=True)))
+        self.assertIsNot(type(Symbol('a', only_nesy=True)), type(Symbol('a', iterate_nesy=True)))
+
+    def test_flag_isolation(self):
+        only_nesy    = Symbol('a', only_nesy=True)
+        iterate_nesy = Symbol('a', iterate_nesy=True)
+        default      = Symbol('a')
+        self.assertTrue(only_nesy.__disable_shortcut_matches__)
+        self.assertFalse(only_nesy.__nesy_iteration_primitives__)
+        self.assertFalse(iterate_nesy.__disable_shortcut_matches__)
+        self.assertTrue(iterate_nesy.__nesy_iteration_primitives__)
+        self.assertFalse(default.__disable_shortcut_matches__)
+        self.assertFalse(default.__nesy_iteration_primitives__)
+        # the flags live on the cached mixin types and never leak into the types of default symbols
+        self.assertFalse(type(default).__disable_shortcut_matches__)
+        self.assertFalse(type(default).__nesy_iteration_primitives__)
+        self.assertFalse(Symbol('b').__disable_shortcut_matches__)
+
+    def test_unused_types_released(self):
+        sym       = Symbol('a', only_nesy=True, iterate_nesy=True)
+        mixin_cls = weakref.ref(type(sym))
+        self.assertIn(mixin_cls(), list(Symbol._mixin_types.values()))
+        del sym
+        gc.collect()
+        self.assertIsNone(mixin_cls())
+
+    def test_save_load_flags(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            for kwargs in [{}, {'only_nesy': True}, {'iterate_nesy': True}, {'only_nesy': True, 'iterate_nesy': True}]:
+                with self.subTest(**kwargs):
+                    path = os.path.join(tmp, f'{len(kwargs)}_{"_".join(kwargs)}.pkl')
+                    sym  = Symbol('a', **kwargs)
+                    sym.save(path, replace=True)
+                    res  = sym.load(path)
+                    self.assertEqual(res.value, 'a')
+                    self.assertEqual(res.__disable_shortcut_matches__, kwargs.get('only_nesy', False))
+                    self.assertEqual(res.__nesy_iteration_primitives__, kwargs.get('iterate_nesy', False))
+                    # loading restores the flags on the instance without changing other symbols
+                    self.assertFalse(Symbol('b').__disable_shortcut_matches__)
+                    self.assertFalse(Symbol('b').__nesy_iteration_primitives__)
+
+
+if __name__ == '__main__':
+    unittest.main()